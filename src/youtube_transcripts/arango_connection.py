@@ -30,13 +30,14 @@ class ArangoConnection:
     def __init__(self, db_name: str = "memory_bank",
                  host: str = "http://localhost:8529",
                  username: str = "root",
-                 password: str = ""):
+                 password: str = "",
+                 request_timeout: float = 60):
         """Initialize connection parameters"""
         self.db_name = db_name
         self.host = host
         self.username = username
         self.password = password
-        self.client = ArangoClient(hosts=host)
+        self.client = ArangoClient(hosts=host, request_timeout=request_timeout)
 
         # Collection names following Granger convention
         self.collections = {
@@ -41,10 +41,11 @@ class YouTubeTranscriptGraph:
     def __init__(self, db_name: str = "memory_bank",
                  host: str = "http://localhost:8529",
                  username: str = "root",
-                 password: str = ""):
+                 password: str = "",
+                 request_timeout: float = 60):
         """Initialize connection to ArangoDB"""
         # Setup connection
-        self.connection = ArangoConnection(db_name, host, username, password)
+        self.connection = ArangoConnection(db_name, host, username, password, request_timeout)
         self.db = self.connection.connect()
 
         # Ensure collections and indexes exist
@@ -64,6 +65,10 @@ class YouTubeTranscriptGraph:
         """Store a transcript with all its relationships"""
         return await self.ops.store_transcript(video_data)
 
+    async def store_transcripts(self, videos: list[dict[str, Any]]) -> list[str]:
+        """Store many transcripts with a bulk import"""
+        return await self.ops.store_transcripts(videos)
+
     async def hybrid_search(self, query: str, limit: int = 10,
                           filters: dict[str, Any] | None = None) -> list[dict[str, Any]]:
         """Perform hybrid search combining full-text and semantic search"""
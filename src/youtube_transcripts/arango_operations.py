@@ -54,8 +54,40 @@ class YouTubeTranscriptOperations:
         Returns:
             Document ID of the stored transcript
         """
-        # Extract base transcript data
-        transcript_doc = {
+        # Store transcript
+        transcripts = self.db.collection(self.collections['transcripts'])
+        transcript = transcripts.insert(await self._transcript_doc(video_data), overwrite=True)
+        transcript_id = transcript['_id']
+
+        await self._store_relationships(transcript_id, video_data)
+
+        return transcript_id
+
+    async def store_transcripts(self, videos: list[dict[str, Any]]) -> list[str]:
+        """
+        Store many transcripts, importing the transcript documents in one request
+        
+        Args:
+            videos: List of transcript data dictionaries
+            
+        Returns:
+            Document IDs of the stored transcripts
+        """
+        transcripts = self.db.collection(self.collections['transcripts'])
+        docs = [await self._transcript_doc(video_data) for video_data in videos]
+        transcripts.import_bulk(docs, overwrite=False, on_duplicate='replace')
+
+        transcript_ids = []
+        for video_data in videos:
+            transcript_id = f"{self.collections['transcripts']}/{video_data['video_id']}"
+            await self._store_relationships(transcript_id, video_data)
+            transcript_ids.append(transcript_id)
+
+        return transcript_ids
+
+    async def _transcript_doc(self, video_data: dict[str, Any]) -> dict[str, Any]:
+        """Build the transcript document stored for a video"""
+        return {
             '_key': video_data['video_id'],
             'video_id': video_data['video_id'],
             'title': video_data.get('title', ''),
@@ -75,11 +107,8 @@ class YouTubeTranscriptOperations:
             )
         }
 
-        # Store transcript
-        transcripts = self.db.collection(self.collections['transcripts'])
-        transcript = transcripts.insert(transcript_doc, overwrite=True)
-        transcript_id = transcript['_id']
-
+    async def _store_relationships(self, transcript_id: str, video_data: dict[str, Any]):
+        """Store the channel, citations, speakers, entities and claims of a transcript"""
         # Store channel if not exists
         await self._store_channel(video_data)
 
@@ -99,8 +128,6 @@ class YouTubeTranscriptOperations:
         if 'claims' in video_data:
             await self._store_claims(transcript_id, video_data['claims'])
 
-        return transcript_id
-
     async def _store_channel(self, video_data: dict[str, Any]):
         """Store channel information"""
         if not video_data.get('channel_id'):
@@ -50,6 +50,40 @@ def add_transcript(video_id: str, title: str, channel_name: str, publish_date: s
     conn.commit()
     conn.close()
 
+def add_transcripts(rows: list[tuple[str, str, str, str, str, str, str]],
+                    db_path: Path = DB_PATH, conn: sqlite3.Connection | None = None) -> None:
+    """Add a batch of transcripts in one transaction
+
+    Each row is (video_id, title, channel_name, publish_date, transcript,
+    summary, enhanced_transcript). Pass conn to reuse an open connection.
+    """
+    own_conn = conn is None
+    if own_conn:
+        conn = sqlite3.connect(db_path)
+    try:
+        with conn:
+            conn.executemany('''
+                INSERT OR REPLACE INTO transcripts 
+                (video_id, title, channel_name, publish_date, transcript, summary, enhanced_transcript)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+    finally:
+        if own_conn:
+            conn.close()
+
+def check_transcript_exists(video_id: str, db_path: Path = DB_PATH,
+                            conn: sqlite3.Connection | None = None) -> bool:
+    """Check whether a transcript is stored. Pass conn to reuse an open connection"""
+    own_conn = conn is None
+    if own_conn:
+        conn = sqlite3.connect(db_path)
+    try:
+        cursor = conn.execute('SELECT 1 FROM transcripts WHERE video_id = ? LIMIT 1', (video_id,))
+        return cursor.fetchone() is not None
+    finally:
+        if own_conn:
+            conn.close()
+
 def search_transcripts(query: str, channel_names: list[str] | None = None,
                       limit: int = 10, db_path: Path = DB_PATH) -> list[dict[str, Any]]:
     """Search transcripts using FTS5 (BM25 ranking)"""
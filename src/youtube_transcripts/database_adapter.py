@@ -19,16 +19,27 @@ Example Usage:
 """
 
 import asyncio
+import copy
 import json
 import logging
+import os
+import queue
+import re
 import sqlite3
+import threading
+import time
+import uuid
+from collections import ChainMap, OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
 from typing import Any, Protocol
 
 logger = logging.getLogger(__name__)
 
 # Check for ArangoDB availability
 try:
-    from arango import ArangoClient
+    from arango.exceptions import DocumentGetError
 
     from .arango_integration import YouTubeTranscriptGraph
     HAS_ARANGO = True
@@ -36,6 +47,167 @@ except ImportError:
     HAS_ARANGO = False
     logger.info("ArangoDB not available, will use SQLite backend")
 
+# orjson is an optional fast path for serializing metadata
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _adapt_dict(value: dict) -> str:
+    """Serialize a dict parameter to compact JSON text"""
+    if HAS_ORJSON:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value, separators=(',', ':'))
+
+
+# Metadata dicts are bound directly as parameters and stored as JSON text
+sqlite3.register_adapter(dict, _adapt_dict)
+
+
+def _rows_to_dicts(cursor: sqlite3.Cursor) -> list[dict[str, Any]]:
+    """Fetch all rows as dicts, reading the column names only once"""
+    columns = [column[0] for column in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+# Connection-level tuning applied once to every persistent SQLite connection.
+# Keys match SQLiteConfig so values from the database config override these.
+_DEFAULT_PRAGMAS: dict[str, Any] = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'cache_size': -64000,
+    'temp_store': 'MEMORY',
+    'busy_timeout': 5000,
+    'mmap_size': 268435456,
+}
+
+# Database-wide settings that only the writer connection should change
+_WRITER_ONLY_PRAGMAS = frozenset({'journal_mode', 'synchronous'})
+
+# Porter stemming over unicode61 keeps English recall while splitting
+# non-Latin scripts and folding diacritics correctly
+_DEFAULT_FTS_TOKENIZE = 'porter unicode61 remove_diacritics 2'
+
+# Query tokens FTS5 accepts unquoted: bare words, prefix terms and operators
+_FTS_BAREWORD = re.compile(r'\w+\*?')
+
+# Columns of the main full-text index, which queries may filter on
+_FTS_COLUMNS = ('title', 'channel_name', 'transcript', 'summary')
+
+# FTS5 query syntax kept as written when sanitizing: quoted phrases, column
+# filters, NEAR groups with their distance, and parentheses. Anything else
+# up to whitespace, a quote, a comma or a parenthesis is a term.
+_FTS_SYNTAX = re.compile(r'''
+    (?P<phrase>"(?:[^"]|"")*"\*?)
+  | (?P<column>-?(?:\{[\w\s]*\}|\w+)\s*:)(?=\s*[^\s)])
+  | (?P<near>NEAR\(|,\s*\d+\s*(?=\)))
+  | (?P<paren>[()])
+  | (?P<term>[^\s"(),]+)
+  | (?P<space>\s+|[",])
+''', re.X)
+_FTS_TERM = re.compile(r'[^\s"(),]+')
+
+_TRANSCRIPTS_DOC_DDL = '''
+    CREATE TABLE IF NOT EXISTS {schema}.transcripts_doc (
+        id INTEGER PRIMARY KEY,
+        video_id TEXT NOT NULL UNIQUE,
+        title TEXT,
+        channel_name TEXT,
+        publish_date TEXT,
+        transcript TEXT,
+        summary TEXT,
+        metadata TEXT
+    )
+'''
+
+# Search statements, one fixed text per filter combination so each stays
+# compiled in the connection's statement cache. {table} is the FTS5 index
+# and {schema} is 'main', or 'mem' when searches are served from RAM.
+# The inner query ranks and limits rowids first so snippet() only runs
+# for the rows actually returned; the outer MATCH gives snippet() its
+# query context.
+_SEARCH_SQL_TOP = '''
+        SELECT {table}.rowid FROM {schema}.{table}
+        JOIN {schema}.transcripts_doc d ON d.id = {table}.rowid
+        WHERE {table} MATCH :query'''
+_SEARCH_SQL_FETCH = '''
+    SELECT d.video_id, d.title, d.channel_name, d.publish_date,
+           snippet({table}, -1, '<b>', '</b>', '...', 32) as snippet,
+           {table}.rank AS rank
+    FROM {schema}.{table}
+    JOIN {schema}.transcripts_doc d ON d.id = {table}.rowid
+    WHERE {table} MATCH :query AND {table}.rowid IN ('''
+_SEARCH_SQL_ORDER = '''
+        ORDER BY rank LIMIT :limit
+    )
+    ORDER BY rank
+'''
+
+# Keyed by (has channel filter, has date filter)
+_SEARCH_FILTERS: dict[tuple[bool, bool], str] = {
+    (False, False): '',
+    (True, False): ' AND d.channel_name = :channel',
+    (False, True): ' AND d.publish_date >= :date_after',
+    (True, True): ' AND d.channel_name = :channel AND d.publish_date >= :date_after',
+}
+
+_SEARCH_SQL: dict[tuple[bool, bool], str] = {
+    key: _SEARCH_SQL_FETCH + _SEARCH_SQL_TOP + condition + _SEARCH_SQL_ORDER
+    for key, condition in _SEARCH_FILTERS.items()
+}
+
+# Trigrams cannot match terms shorter than three characters, such as
+# two-character CJK words, so those are found by a substring scan instead
+_SHORT_SEARCH_SQL_BASE = '''
+    SELECT d.video_id, d.title, d.channel_name, d.publish_date,
+           substr(d.transcript, max(instr(d.transcript, :term) - 32, 1), 64) AS snippet,
+           0.0 AS rank
+    FROM {schema}.transcripts_tri
+    JOIN {schema}.transcripts_doc d ON d.id = transcripts_tri.rowid
+    WHERE (transcripts_tri.title LIKE :pattern ESCAPE '\\'
+           OR transcripts_tri.transcript LIKE :pattern ESCAPE '\\')'''
+_SHORT_SEARCH_SQL: dict[tuple[bool, bool], str] = {
+    key: _SHORT_SEARCH_SQL_BASE + condition + '\n    LIMIT :limit\n'
+    for key, condition in _SEARCH_FILTERS.items()
+}
+
+_EVIDENCE_SQL = '''
+    SELECT d.video_id, d.title, d.channel_name AS channel,
+           snippet(transcripts, -1, '<b>', '</b>', '...', 32) AS text,
+           abs(transcripts.rank) AS confidence,
+           'potential' AS evidence_type,
+           'Text similarity match' AS reasoning
+    FROM {schema}.transcripts
+    JOIN {schema}.transcripts_doc d ON d.id = transcripts.rowid
+    WHERE transcripts MATCH :claim AND transcripts.rowid IN (
+        SELECT rowid FROM {schema}.transcripts
+        WHERE transcripts MATCH :claim
+        ORDER BY rank LIMIT 20
+    )
+    ORDER BY transcripts.rank
+'''
+
+# Copies a freshly written document into the in-memory search mirror
+_MIRROR_DOC_SQL = '''
+    INSERT INTO mem.transcripts_doc
+    SELECT * FROM main.transcripts_doc WHERE video_id = ?
+    ON CONFLICT(id) DO UPDATE SET
+        video_id = excluded.video_id,
+        title = excluded.title,
+        channel_name = excluded.channel_name,
+        publish_date = excluded.publish_date,
+        transcript = excluded.transcript,
+        summary = excluded.summary,
+        metadata = excluded.metadata
+'''
+
+# Takes the names as a JSON array so the statement text never varies
+_SPEAKER_IDS_SQL = '''
+    SELECT name, id FROM speakers
+    WHERE name IN (SELECT value FROM json_each(?))
+'''
+
 
 class DatabaseBackend(Protocol):
     """Protocol defining the interface for database backends"""
@@ -49,6 +221,10 @@ class DatabaseBackend(Protocol):
         """Store a transcript"""
         ...
 
+    async def store_transcripts(self, videos: list[dict[str, Any]]) -> list[str]:
+        """Store many transcripts in one batch"""
+        ...
+
     async def get_transcript(self, video_id: str) -> dict[str, Any] | None:
         """Retrieve a transcript by ID"""
         ...
@@ -63,31 +239,128 @@ class DatabaseBackend(Protocol):
 
 
 class SQLiteBackend:
-    """SQLite backend for standalone usage"""
+    """SQLite backend for standalone usage
+
+    Connections are long-lived so the page cache and compiled statements
+    survive across calls. One writer connection handles all writes while a
+    pool of read-only connections serves queries; in WAL mode readers never
+    block on, or are blocked by, the writer.
 
-    def __init__(self, db_path: str = "youtube_transcripts.db"):
+    With ``preload_into_memory`` the transcript documents and FTS indexes
+    are also copied into an in-process memdb database attached to every
+    connection as ``mem``. Searches then run entirely from RAM and each
+    store_transcript updates the mirror in the same transaction.
+    """
+
+    def __init__(self, db_path: str = "youtube_transcripts.db",
+                 config: dict[str, Any] | None = None):
         self.db_path = db_path
+        self.config = config or {}
+        self._trigram = bool(self.config.get('fts_trigram', False))
+        self._speaker_ids: dict[str, int] = {}
+
+        # memdb databases are shared by name between connections in this process
+        self._memdb_uri = None
+        if self.config.get('preload_into_memory', False):
+            self._memdb_uri = f"file:/youtube_transcripts_{uuid.uuid4().hex}?vfs=memdb"
+        search_schema = 'mem' if self._memdb_uri else 'main'
+        self._search_sql = {
+            table: {key: sql.format(schema=search_schema, table=table) for key, sql in _SEARCH_SQL.items()}
+            for table in ('transcripts', 'transcripts_tri')
+        }
+        self._short_search_sql = {key: sql.format(schema=search_schema) for key, sql in _SHORT_SEARCH_SQL.items()}
+        self._evidence_sql = _EVIDENCE_SQL.format(schema=search_schema)
+
+        self._uri = Path(db_path).resolve().as_uri()
+        self._write_lock = threading.Lock()
+        # Autocommit mode: transactions are opened explicitly with BEGIN IMMEDIATE
+        self._write_conn = sqlite3.connect(self._uri, uri=True, check_same_thread=False,
+                                           isolation_level=None)
+        self._apply_pragmas(self._write_conn)
         self._initialize_database()
 
+        # Readers are opened after the schema exists and WAL is enabled
+        pool_size = self.config.get('read_pool_size') or os.cpu_count() or 4
+        self._read_pool: queue.Queue[sqlite3.Connection] = queue.Queue()
+        for _ in range(pool_size):
+            self._read_pool.put(self._open_reader())
+
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a read-only connection to the database file"""
+        conn = sqlite3.connect(f"{self._uri}?mode=ro", uri=True, check_same_thread=False)
+        self._apply_pragmas(conn, read_only=True)
+        if self._memdb_uri:
+            conn.execute('ATTACH DATABASE ? AS mem', (self._memdb_uri,))
+        return conn
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Check a reader out of the pool, waiting if all are in use"""
+        conn = self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+
+    @contextmanager
+    def _write_transaction(self) -> Iterator[sqlite3.Connection]:
+        """Hold the write lock and run the block inside BEGIN IMMEDIATE
+
+        Taking the database write lock up front means a concurrent writer
+        waits on busy_timeout once instead of failing part way through.
+        """
+        with self._write_lock:
+            conn = self._write_conn
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield conn
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            conn.execute('COMMIT')
+
+    def _apply_pragmas(self, conn: sqlite3.Connection, read_only: bool = False):
+        """Apply performance PRAGMAs, honouring overrides from the config"""
+        for name, default in _DEFAULT_PRAGMAS.items():
+            if read_only and name in _WRITER_ONLY_PRAGMAS:
+                continue
+            value = self.config.get(name, default)
+            # PRAGMA values cannot be bound as parameters, so only allow
+            # plain numbers and keywords through
+            if not str(value).lstrip('-').isalnum():
+                raise ValueError(f"Invalid value for PRAGMA {name}: {value!r}")
+            conn.execute(f'PRAGMA {name}={value}')
+
+    def close(self):
+        """Close the writer and every pooled reader"""
+        self._write_conn.close()
+        while not self._read_pool.empty():
+            self._read_pool.get_nowait().close()
+
     def _initialize_database(self):
         """Initialize SQLite database with FTS5"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Main transcripts table with FTS5
-        cursor.execute('''
-            CREATE VIRTUAL TABLE IF NOT EXISTS transcripts
-            USING fts5(
-                video_id UNINDEXED,
-                title,
-                channel_name,
-                publish_date UNINDEXED,
-                transcript,
-                summary,
-                metadata UNINDEXED,
-                tokenize=porter
-            )
-        ''')
+        tokenize = self.config.get('fts_tokenize', _DEFAULT_FTS_TOKENIZE)
+        if not all(part.replace('_', '').isalnum() for part in tokenize.split()):
+            raise ValueError(f"Invalid FTS5 tokenizer: {tokenize!r}")
+
+        with self._write_transaction() as conn:
+            self._create_schema(conn.cursor(), tokenize)
+
+        if self._memdb_uri:
+            # ATTACH is not allowed inside a transaction
+            self._write_conn.execute('ATTACH DATABASE ? AS mem', (self._memdb_uri,))
+            with self._write_transaction() as conn:
+                cursor = conn.cursor()
+                cursor.execute(_TRANSCRIPTS_DOC_DDL.format(schema='mem'))
+                cursor.execute('INSERT INTO mem.transcripts_doc SELECT * FROM main.transcripts_doc')
+                self._create_fts_indexes(cursor, 'mem', tokenize)
+
+    def _create_schema(self, cursor: sqlite3.Cursor, tokenize: str):
+        # Transcript documents live in a normal table; the FTS5 indexes
+        # only reference it, so each transcript is stored once
+        cursor.execute(_TRANSCRIPTS_DOC_DDL.format(schema='main'))
+        self._migrate_legacy_fts(cursor)
+        self._create_fts_indexes(cursor, 'main', tokenize)
 
         # Evidence table for research features
         cursor.execute('''
@@ -144,196 +417,361 @@ class SQLiteBackend:
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_evidence_claim ON evidence(claim)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_citations_video ON citations(video_id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_video_speakers ON video_speakers(video_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_doc_channel ON transcripts_doc(channel_name)')
+
+    def _migrate_legacy_fts(self, cursor: sqlite3.Cursor):
+        """Move documents out of FTS tables that stored their own content
+
+        Earlier versions kept every column inside the FTS5 table. Those rows
+        are copied into transcripts_doc and the old tables dropped, to be
+        recreated and rebuilt as external-content indexes.
+        """
+        cursor.execute('''
+            SELECT name, sql FROM sqlite_master
+            WHERE name IN ('transcripts', 'transcripts_tri')
+        ''')
+        legacy = [name for name, sql in cursor.fetchall() if 'transcripts_doc' not in sql]
+        if 'transcripts' in legacy:
+            # Ordered by rowid so the latest copy of a re-stored video wins
+            cursor.execute('''
+                INSERT OR REPLACE INTO transcripts_doc
+                (video_id, title, channel_name, publish_date, transcript, summary, metadata)
+                SELECT video_id, title, channel_name, publish_date, transcript, summary, metadata
+                FROM transcripts ORDER BY rowid
+            ''')
+        for name in legacy:
+            logger.info(f"Migrating {name} to an external-content FTS5 index")
+            cursor.execute(f'DROP TABLE {name}')
+
+    def _create_fts_indexes(self, cursor: sqlite3.Cursor, schema: str, tokenize: str):
+        # Main full-text index
+        self._create_fts_index(cursor, schema, 'transcripts', _FTS_COLUMNS, tokenize)
+
+        # Optional trigram index so CJK text can be matched by substring
+        if self._trigram:
+            self._create_fts_index(cursor, schema, 'transcripts_tri', ('title', 'transcript'), 'trigram')
+
+    def _create_fts_index(self, cursor: sqlite3.Cursor, schema: str, table: str,
+                          columns: tuple[str, ...], tokenize: str):
+        """Create an FTS5 index over transcripts_doc and the triggers that sync it"""
+        cursor.execute(f'SELECT 1 FROM {schema}.sqlite_master WHERE name = ?', (table,))
+        exists = cursor.fetchone() is not None
+
+        cols = ', '.join(columns)
+        new_values = ', '.join(f'new.{col}' for col in columns)
+        old_values = ', '.join(f'old.{col}' for col in columns)
+
+        cursor.execute(f'''
+            CREATE VIRTUAL TABLE IF NOT EXISTS {schema}.{table}
+            USING fts5(
+                {cols},
+                content='transcripts_doc',
+                content_rowid='id',
+                tokenize='{tokenize}'
+            )
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {schema}.{table}_ai AFTER INSERT ON transcripts_doc BEGIN
+                INSERT INTO {table}(rowid, {cols}) VALUES (new.id, {new_values});
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {schema}.{table}_ad AFTER DELETE ON transcripts_doc BEGIN
+                INSERT INTO {table}({table}, rowid, {cols}) VALUES ('delete', old.id, {old_values});
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {schema}.{table}_au AFTER UPDATE ON transcripts_doc BEGIN
+                INSERT INTO {table}({table}, rowid, {cols}) VALUES ('delete', old.id, {old_values});
+                INSERT INTO {table}(rowid, {cols}) VALUES (new.id, {new_values});
+            END
+        ''')
 
-        conn.commit()
-        conn.close()
+        # A new index over existing documents starts empty until rebuilt
+        if not exists:
+            cursor.execute(f"INSERT INTO {schema}.{table}({table}) VALUES ('rebuild')")
+
+    # Every public coroutine hands its blocking sqlite3 work to a worker
+    # thread so queries never stall the event loop
 
     async def search(self, query: str, limit: int = 10,
                     filters: dict[str, Any] | None = None) -> list[dict[str, Any]]:
         """Search transcripts using FTS5"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        return await asyncio.to_thread(self._search_sync, query, limit, filters)
 
-        # Build query with filters
-        base_query = '''
-            SELECT video_id, title, channel_name, publish_date, 
-                   snippet(transcripts, -1, '<b>', '</b>', '...', 32) as snippet,
-                   rank
-            FROM transcripts
-            WHERE transcripts MATCH ?
-        '''
+    @staticmethod
+    def _fts_quote(term: str) -> str:
+        """Quote a term unless FTS5 already reads it as a bare word"""
+        if _FTS_BAREWORD.fullmatch(term):
+            return term
+        return '"' + term.replace('"', '""') + '"'
 
-        params = [query]
+    @classmethod
+    def _fts_sanitize(cls, query: str) -> str:
+        """Quote terms FTS5 would parse as syntax, e.g. ``arXiv:1706.03762``
 
-        if filters:
-            if 'channel' in filters:
-                base_query += ' AND channel_name = ?'
-                params.append(filters['channel'])
+        Quoted phrases, filters on indexed columns, NEAR groups and balanced
+        parentheses are kept, so deliberate FTS5 queries behave as before.
+        """
+        parts = []
+        depth = 0
+        pos = 0
+        while pos < len(query):
+            match = _FTS_SYNTAX.match(query, pos)
+            kind = match.lastgroup
+            if kind == 'column' and not set(re.findall(r'\w+', match.group())) <= set(_FTS_COLUMNS):
+                # e.g. the 'arXiv:' of an identifier, not a column filter
+                match = _FTS_TERM.match(query, pos)
+                kind = 'term'
+            text = match.group()
+            pos = match.end()
+
+            if kind == 'term':
+                parts.append(cls._fts_quote(text))
+            elif kind == 'space':
+                parts.append(' ')
+            else:
+                if text == '(' or kind == 'near' and text.endswith('('):
+                    depth += 1
+                elif text == ')':
+                    depth -= 1
+                    if depth < 0:
+                        break
+                parts.append(text)
+
+        if depth != 0:
+            return cls._fts_quote_all(query)
+        return ''.join(parts).strip()
+
+    @staticmethod
+    def _fts_quote_all(query: str) -> str:
+        """Quote every whitespace-separated token, operators included"""
+        return ' '.join('"' + token.replace('"', '""') + '"' for token in query.split())
+
+    def _search_sync(self, query: str, limit: int,
+                     filters: dict[str, Any] | None) -> list[dict[str, Any]]:
+        search_sql = self._search_sql['transcripts']
+        try:
+            results = self._run_search(search_sql, {'query': self._fts_sanitize(query), 'limit': limit}, filters)
+        except sqlite3.OperationalError:
+            # Syntax kept by the sanitizer can still be malformed, e.g. a
+            # dangling AND, so retry with every token taken literally
+            results = self._run_search(search_sql, {'query': self._fts_quote_all(query), 'limit': limit}, filters)
+
+        # The word tokenizer cannot split CJK text, so top up non-ASCII
+        # queries with hits from the trigram index
+        if self._trigram and len(results) < limit and not query.isascii():
+            term = query.strip()
+            if len(term) < 3:
+                escaped = term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+                extra = self._run_search(self._short_search_sql,
+                                         {'term': term, 'pattern': f'%{escaped}%', 'limit': limit}, filters)
+            else:
+                phrase = '"' + query.replace('"', '""') + '"'
+                extra = self._run_search(self._search_sql['transcripts_tri'],
+                                         {'query': phrase, 'limit': limit}, filters)
+            seen = {result['video_id'] for result in results}
+            for result in extra:
+                if result['video_id'] not in seen and len(results) < limit:
+                    results.append(result)
 
-            if 'date_after' in filters:
-                base_query += ' AND publish_date >= ?'
-                params.append(filters['date_after'])
+        return results
 
-        base_query += ' ORDER BY rank LIMIT ?'
-        params.append(limit)
+    def _run_search(self, sql: dict[tuple[bool, bool], str], params: dict[str, Any],
+                    filters: dict[str, Any] | None) -> list[dict[str, Any]]:
+        """Run one of the per-filter search statements with the filter values bound"""
+        filters = filters or {}
+        has_channel = 'channel' in filters
+        has_date = 'date_after' in filters
 
-        cursor.execute(base_query, params)
-        results = [dict(row) for row in cursor.fetchall()]
+        if has_channel:
+            params['channel'] = filters['channel']
+        if has_date:
+            params['date_after'] = filters['date_after']
 
-        conn.close()
-        return results
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql[has_channel, has_date], params)
+            return _rows_to_dicts(cursor)
 
     async def store_transcript(self, video_data: dict[str, Any]) -> str:
         """Store transcript in SQLite"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        await asyncio.to_thread(self._store_transcripts_sync, [video_data])
+        return video_data['video_id']
 
-        # Store main transcript
-        metadata = json.dumps(video_data.get('metadata', {}))
+    async def store_transcripts(self, videos: list[dict[str, Any]]) -> list[str]:
+        """Store many transcripts in a single transaction"""
+        if videos:
+            await asyncio.to_thread(self._store_transcripts_sync, videos)
+        return [video_data['video_id'] for video_data in videos]
+
+    def _store_transcripts_sync(self, videos: list[dict[str, Any]]):
+        new_speaker_ids: dict[str, int] = {}
+        with self._write_transaction() as conn:
+            self._store_transcripts(conn, videos, new_speaker_ids)
+        # Only cache ids once the rows that created them are committed
+        self._speaker_ids.update(new_speaker_ids)
+
+    def _store_transcripts(self, conn: sqlite3.Connection, videos: list[dict[str, Any]],
+                           new_speaker_ids: dict[str, int]):
+        """Write transcripts and their citations/speakers in the open transaction
+
+        Each table is written with one executemany across the whole batch.
+        Speaker ids looked up from the database are added to new_speaker_ids
+        so the caller can cache them after commit.
+        """
+        cursor = conn.cursor()
 
-        cursor.execute('''
-            INSERT OR REPLACE INTO transcripts 
+        # Upsert keeps the row id stable so the FTS triggers see an UPDATE
+        cursor.executemany('''
+            INSERT INTO transcripts_doc
             (video_id, title, channel_name, publish_date, transcript, summary, metadata)
             VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            video_data['video_id'],
-            video_data['title'],
-            video_data.get('channel_name', ''),
-            video_data.get('upload_date', ''),
-            video_data['transcript'],
-            video_data.get('summary', ''),
-            metadata
-        ))
-
-        # Store citations if present
-        if 'citations' in video_data:
-            for citation in video_data['citations']:
-                cursor.execute('''
-                    INSERT INTO citations 
-                    (video_id, citation_type, identifier, text, context, confidence, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    video_data['video_id'],
-                    citation['type'],
-                    citation.get('id', ''),
-                    citation['text'],
-                    citation.get('context', ''),
-                    citation.get('confidence', 1.0),
-                    json.dumps(citation.get('metadata', {}))
-                ))
-
-        # Store speakers if present
-        if 'speakers' in video_data:
-            for speaker in video_data['speakers']:
-                # Insert or get speaker
-                cursor.execute('''
+            ON CONFLICT(video_id) DO UPDATE SET
+                title = excluded.title,
+                channel_name = excluded.channel_name,
+                publish_date = excluded.publish_date,
+                transcript = excluded.transcript,
+                summary = excluded.summary,
+                metadata = excluded.metadata
+        ''', [
+            (
+                video_data['video_id'],
+                video_data['title'],
+                video_data.get('channel_name', ''),
+                video_data.get('upload_date', ''),
+                video_data['transcript'],
+                video_data.get('summary', ''),
+                video_data.get('metadata', {})
+            )
+            for video_data in videos
+        ])
+
+        if self._memdb_uri:
+            cursor.executemany(_MIRROR_DOC_SQL, [(video_data['video_id'],) for video_data in videos])
+
+        citation_rows = [
+            (
+                video_data['video_id'],
+                citation['type'],
+                citation.get('id', ''),
+                citation['text'],
+                citation.get('context', ''),
+                citation.get('confidence', 1.0),
+                citation.get('metadata', {})
+            )
+            for video_data in videos
+            for citation in video_data.get('citations', ())
+        ]
+        if citation_rows:
+            cursor.executemany('''
+                INSERT INTO citations 
+                (video_id, citation_type, identifier, text, context, confidence, metadata)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', citation_rows)
+
+        speaker_links = [
+            (video_data['video_id'], speaker)
+            for video_data in videos
+            for speaker in video_data.get('speakers') or ()
+        ]
+        if speaker_links:
+            # Speakers seen before already have a cached id; only new names
+            # need inserting and looking up
+            uncached = [speaker for _, speaker in speaker_links
+                        if speaker['name'] not in self._speaker_ids]
+            if uncached:
+                cursor.executemany('''
                     INSERT OR IGNORE INTO speakers (name, title, affiliation)
                     VALUES (?, ?, ?)
-                ''', (
-                    speaker['name'],
-                    speaker.get('title', ''),
-                    speaker.get('affiliation', '')
-                ))
-
-                cursor.execute('SELECT id FROM speakers WHERE name = ?', (speaker['name'],))
-                speaker_id = cursor.fetchone()[0]
-
-                # Link to video
-                cursor.execute('''
-                    INSERT OR REPLACE INTO video_speakers (video_id, speaker_id, role)
-                    VALUES (?, ?, ?)
-                ''', (
-                    video_data['video_id'],
-                    speaker_id,
-                    speaker.get('role', 'speaker')
-                ))
-
-        conn.commit()
-        conn.close()
-
-        return video_data['video_id']
+                ''', [
+                    (speaker['name'], speaker.get('title', ''), speaker.get('affiliation', ''))
+                    for speaker in uncached
+                ])
+
+                # Resolve every new speaker id in one round trip
+                names = list({speaker['name'] for speaker in uncached})
+                cursor.execute(_SPEAKER_IDS_SQL, (json.dumps(names),))
+                new_speaker_ids.update(cursor.fetchall())
+
+            speaker_ids = ChainMap(new_speaker_ids, self._speaker_ids)
+
+            # Link to videos
+            cursor.executemany('''
+                INSERT OR REPLACE INTO video_speakers (video_id, speaker_id, role)
+                VALUES (?, ?, ?)
+            ''', [
+                (video_id, speaker_ids[speaker['name']], speaker.get('role', 'speaker'))
+                for video_id, speaker in speaker_links
+            ])
 
     async def get_transcript(self, video_id: str) -> dict[str, Any] | None:
         """Get transcript by video ID"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT * FROM transcripts WHERE video_id = ?
-        ''', (video_id,))
-
-        row = cursor.fetchone()
-        if not row:
-            conn.close()
-            return None
+        return await asyncio.to_thread(self._get_transcript_sync, video_id)
+
+    def _get_transcript_sync(self, video_id: str) -> dict[str, Any] | None:
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT video_id, title, channel_name, publish_date, transcript, summary, metadata
+                FROM transcripts_doc WHERE video_id = ?
+            ''', (video_id,))
+
+            rows = _rows_to_dicts(cursor)
+            if not rows:
+                return None
+
+            result = rows[0]
+
+            # Get citations
+            cursor.execute('''
+                SELECT * FROM citations WHERE video_id = ?
+            ''', (video_id,))
+            result['citations'] = _rows_to_dicts(cursor)
+
+            # Get speakers
+            cursor.execute('''
+                SELECT s.* FROM speakers s
+                JOIN video_speakers vs ON s.id = vs.speaker_id
+                WHERE vs.video_id = ?
+            ''', (video_id,))
+            result['speakers'] = _rows_to_dicts(cursor)
 
-        result = dict(row)
-
-        # Get citations
-        cursor.execute('''
-            SELECT * FROM citations WHERE video_id = ?
-        ''', (video_id,))
-        result['citations'] = [dict(row) for row in cursor.fetchall()]
-
-        # Get speakers
-        cursor.execute('''
-            SELECT s.* FROM speakers s
-            JOIN video_speakers vs ON s.id = vs.speaker_id
-            WHERE vs.video_id = ?
-        ''', (video_id,))
-        result['speakers'] = [dict(row) for row in cursor.fetchall()]
-
-        conn.close()
         return result
 
     async def find_evidence(self, claim: str, evidence_type: str = "both") -> list[dict[str, Any]]:
         """Find evidence for claims - basic implementation for SQLite"""
-        # Search for transcripts mentioning the claim
-        results = await self.search(claim, limit=20)
-
-        evidence = []
-        for result in results:
-            # Basic evidence extraction (without LLM in standalone mode)
-            evidence.append({
-                'video_id': result['video_id'],
-                'title': result['title'],
-                'channel': result['channel_name'],
-                'text': result['snippet'],
-                'confidence': abs(result['rank']),  # Use rank as confidence proxy
-                'evidence_type': 'potential',  # Mark as potential without LLM analysis
-                'reasoning': 'Text similarity match'
-            })
-
-        return evidence
+        return await asyncio.to_thread(self._find_evidence_sync, claim)
+
+    def _find_evidence_sync(self, claim: str) -> list[dict[str, Any]]:
+        # Search for transcripts mentioning the claim and shape the rows in
+        # SQL. Without an LLM in standalone mode every hit is only
+        # 'potential' evidence, with the BM25 rank as a confidence proxy.
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(self._evidence_sql, {'claim': self._fts_sanitize(claim)})
+            except sqlite3.OperationalError:
+                cursor.execute(self._evidence_sql, {'claim': self._fts_quote_all(claim)})
+            return _rows_to_dicts(cursor)
 
     async def find_related(self, video_id: str, limit: int = 10) -> list[dict[str, Any]]:
         """Find related videos - basic implementation"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        return await asyncio.to_thread(self._find_related_sync, video_id, limit)
 
-        # Get original video
-        cursor.execute('SELECT title, channel_name FROM transcripts WHERE video_id = ?', (video_id,))
-        original = cursor.fetchone()
+    def _find_related_sync(self, video_id: str, limit: int) -> list[dict[str, Any]]:
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            # Find videos by the same channel via the channel index
+            cursor.execute('''
+                SELECT r.video_id, r.title, r.channel_name, r.publish_date
+                FROM transcripts_doc o
+                JOIN transcripts_doc r ON r.channel_name = o.channel_name
+                WHERE o.video_id = ? AND r.video_id != o.video_id
+                LIMIT ?
+            ''', (video_id, limit))
 
-        if not original:
-            conn.close()
-            return []
-
-        # Find videos by same channel
-        cursor.execute('''
-            SELECT video_id, title, channel_name, publish_date
-            FROM transcripts
-            WHERE channel_name = ? AND video_id != ?
-            LIMIT ?
-        ''', (original['channel_name'], video_id, limit))
-
-        results = [dict(row) for row in cursor.fetchall()]
-
-        conn.close()
-        return results
+            return _rows_to_dicts(cursor)
 
 
 class ArangoBackend:
@@ -348,7 +786,11 @@ class ArangoBackend:
             db_name=config.get('database', 'memory_bank'),
             host=config.get('host', 'http://localhost:8529'),
             username=config.get('username', 'root'),
-            password=config.get('password', '')
+            password=config.get('password', ''),
+            request_timeout=config.get('request_timeout', 10)
+        )
+        self._transcripts_coll = self.graph.db.collection(
+            self.graph.connection.collections['transcripts']
         )
 
     async def search(self, query: str, limit: int = 10,
@@ -360,13 +802,15 @@ class ArangoBackend:
         """Store transcript in ArangoDB"""
         return await self.graph.store_transcript(video_data)
 
+    async def store_transcripts(self, videos: list[dict[str, Any]]) -> list[str]:
+        """Store many transcripts in ArangoDB with a bulk import"""
+        return await self.graph.store_transcripts(videos)
+
     async def get_transcript(self, video_id: str) -> dict[str, Any] | None:
         """Get transcript from ArangoDB"""
-        collection = self.graph.db.collection(self.graph.collections['transcripts'])
         try:
-            doc = collection.get(video_id)
-            return doc
-        except:
+            return self._transcripts_coll.get(video_id)
+        except DocumentGetError:
             return None
 
     async def find_evidence(self, claim: str, evidence_type: str = "both") -> list[dict[str, Any]]:
@@ -383,6 +827,45 @@ class ArangoBackend:
         return await self.graph.find_related_videos(video_id, limit)
 
 
+# Default lifetime in seconds of DatabaseAdapter's cached reads. Other
+# processes, such as the fetch cron job, write SQLite files without telling
+# this cache, so SQLite entries are kept only briefly.
+_SQLITE_CACHE_TTL = 30
+_DEFAULT_CACHE_TTL = 3600
+
+
+class _TTLCache:
+    """Small LRU cache whose entries expire after a fixed TTL"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Any) -> Any | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
 class DatabaseAdapter:
     """
     Unified database adapter that automatically selects backend
@@ -398,9 +881,22 @@ class DatabaseAdapter:
                 - backend: 'sqlite' or 'arangodb' (auto-detect if not specified)
                 - sqlite_path: Path to SQLite database
                 - arango_config: ArangoDB configuration
+                - cache_enabled: Cache get_transcript/find_related results.
+                  Writes made by other processes are not seen until the
+                  cached entry expires.
+                - cache_ttl: Seconds before a cached result expires
+                  (default 30 for SQLite, 3600 for ArangoDB)
         """
         self.config = config or {}
         self.backend = self._initialize_backend()
+
+        # Reads only touch the cache between awaits, so no lock is needed
+        self._cache_enabled = self.config.get('cache_enabled', True)
+        cache_ttl = self.config.get('cache_ttl')
+        if cache_ttl is None:
+            cache_ttl = _SQLITE_CACHE_TTL if isinstance(self.backend, SQLiteBackend) else _DEFAULT_CACHE_TTL
+        self._transcript_cache = _TTLCache(ttl=cache_ttl)
+        self._related_cache = _TTLCache(ttl=cache_ttl)
         logger.info(f"Using {type(self.backend).__name__} backend")
 
     def _initialize_backend(self) -> DatabaseBackend:
@@ -408,44 +904,28 @@ class DatabaseAdapter:
         backend_name = self.config.get('backend', 'auto')
 
         if backend_name == 'sqlite':
-            return SQLiteBackend(self.config.get('sqlite_path', 'youtube_transcripts.db'))
+            return self._create_sqlite_backend()
 
         elif backend_name == 'arangodb':
             if not HAS_ARANGO:
                 logger.warning("ArangoDB requested but not available, falling back to SQLite")
-                return SQLiteBackend(self.config.get('sqlite_path', 'youtube_transcripts.db'))
+                return self._create_sqlite_backend()
             return ArangoBackend(self.config.get('arango_config', {}))
 
         else:  # auto-detect
-            # Check if ArangoDB is configured and available
-            if HAS_ARANGO and self._check_arango_available():
+            # Constructing the backend doubles as the availability probe
+            if HAS_ARANGO:
                 try:
                     return ArangoBackend(self.config.get('arango_config', {}))
                 except Exception as e:
                     logger.warning(f"ArangoDB initialization failed: {e}, falling back to SQLite")
 
             # Default to SQLite
-            return SQLiteBackend(self.config.get('sqlite_path', 'youtube_transcripts.db'))
-
-    def _check_arango_available(self) -> bool:
-        """Check if ArangoDB is running and accessible"""
-        if not HAS_ARANGO:
-            return False
+            return self._create_sqlite_backend()
 
-        try:
-            # Try to connect to ArangoDB
-            config = self.config.get('arango_config', {})
-            client = ArangoClient(hosts=config.get('host', 'http://localhost:8529'))
-            sys_db = client.db(
-                '_system',
-                username=config.get('username', 'root'),
-                password=config.get('password', '')
-            )
-            # Check if we can access system DB
-            sys_db.version()
-            return True
-        except:
-            return False
+    def _create_sqlite_backend(self) -> "SQLiteBackend":
+        """Create the SQLite backend, passing through any PRAGMA settings"""
+        return SQLiteBackend(self.config.get('sqlite_path', 'youtube_transcripts.db'), self.config)
 
     # Delegate all methods to the backend
     async def search(self, query: str, limit: int = 10,
@@ -455,11 +935,30 @@ class DatabaseAdapter:
 
     async def store_transcript(self, video_data: dict[str, Any]) -> str:
         """Store a transcript"""
-        return await self.backend.store_transcript(video_data)
+        result = await self.backend.store_transcript(video_data)
+        self._invalidate_cache(video_data['video_id'])
+        return result
+
+    async def store_transcripts(self, videos: list[dict[str, Any]]) -> list[str]:
+        """Store many transcripts in one batch"""
+        result = await self.backend.store_transcripts(videos)
+        for video_data in videos:
+            self._invalidate_cache(video_data['video_id'])
+        return result
 
     async def get_transcript(self, video_id: str) -> dict[str, Any] | None:
         """Retrieve a transcript by ID"""
-        return await self.backend.get_transcript(video_id)
+        if not self._cache_enabled:
+            return await self.backend.get_transcript(video_id)
+
+        transcript = self._transcript_cache.get(video_id)
+        if transcript is None:
+            transcript = await self.backend.get_transcript(video_id)
+            if transcript is None:
+                return None
+            self._transcript_cache.set(video_id, transcript)
+        # Each caller gets its own copy, so mutating it can't change later reads
+        return copy.deepcopy(transcript)
 
     async def find_evidence(self, claim: str, evidence_type: str = "both") -> list[dict[str, Any]]:
         """Find evidence for claims"""
@@ -467,7 +966,27 @@ class DatabaseAdapter:
 
     async def find_related(self, video_id: str, limit: int = 10) -> list[dict[str, Any]]:
         """Find related videos"""
-        return await self.backend.find_related(video_id, limit)
+        if not self._cache_enabled:
+            return await self.backend.find_related(video_id, limit)
+
+        key = (video_id, limit)
+        related = self._related_cache.get(key)
+        if related is None:
+            related = await self.backend.find_related(video_id, limit)
+            self._related_cache.set(key, related)
+        return copy.deepcopy(related)
+
+    def _invalidate_cache(self, video_id: str):
+        """Drop cached reads that a newly stored transcript may affect"""
+        self._transcript_cache.pop(video_id)
+        # Any video on the same channel may now have a new related entry
+        self._related_cache.clear()
+
+    def close(self):
+        """Release backend resources such as persistent connections"""
+        close = getattr(self.backend, 'close', None)
+        if close is not None:
+            close()
 
     @property
     def backend_type(self) -> str:
@@ -19,10 +19,13 @@ Example Usage:
 
 import os
 from dataclasses import dataclass
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    from .database_adapter import DatabaseAdapter
+
 # Load environment variables
 load_dotenv()
 
@@ -36,9 +39,16 @@ class SQLiteConfig:
     journal_mode: str = "WAL"  # Write-Ahead Logging for better concurrency
     cache_size: int = -64000  # 64MB cache
     synchronous: str = "NORMAL"  # Balance between safety and speed
+    temp_store: str = "MEMORY"  # Keep temp tables and sorts off disk
+    busy_timeout: int = 5000  # ms to wait on a locked database
+    mmap_size: int = 268435456  # 256MB memory-mapped I/O
 
     # FTS5 settings
-    fts_tokenize: str = "porter"  # Porter stemming for better search
+    fts_tokenize: str = "porter unicode61 remove_diacritics 2"  # Stemming + Unicode-aware splitting
+    fts_trigram: bool = False  # Extra trigram index for CJK substring search
+
+    # Serve searches from an in-memory copy of the FTS index (read-heavy setups)
+    preload_into_memory: bool = False
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -46,7 +56,12 @@ class SQLiteConfig:
             'journal_mode': self.journal_mode,
             'cache_size': self.cache_size,
             'synchronous': self.synchronous,
-            'fts_tokenize': self.fts_tokenize
+            'temp_store': self.temp_store,
+            'busy_timeout': self.busy_timeout,
+            'mmap_size': self.mmap_size,
+            'fts_tokenize': self.fts_tokenize,
+            'fts_trigram': self.fts_trigram,
+            'preload_into_memory': self.preload_into_memory
         }
 
 
@@ -66,6 +81,7 @@ class ArangoDBConfig:
 
     # Connection pool settings
     connection_pool_size: int = 10
+    request_timeout: float = 10.0  # Fail fast when the server is unreachable
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -74,7 +90,8 @@ class ArangoDBConfig:
             'username': self.username,
             'password': self.password,
             'collection_prefix': self.collection_prefix,
-            'graph_name': self.graph_name
+            'graph_name': self.graph_name,
+            'request_timeout': self.request_timeout
         }
 
 
@@ -96,7 +113,7 @@ class DatabaseConfig:
 
     # Cache settings (applies to both backends)
     cache_enabled: bool = True
-    cache_ttl: int = 3600  # 1 hour
+    cache_ttl: int | None = None  # Seconds; None picks the backend default (30s SQLite, 1 hour ArangoDB)
 
     def __post_init__(self):
         if self.sqlite is None:
@@ -125,7 +142,8 @@ class DatabaseConfig:
             username=os.getenv("YOUTUBE_ARANGO_USERNAME", "root"),
             password=os.getenv("YOUTUBE_ARANGO_PASSWORD", ""),
             collection_prefix=os.getenv("YOUTUBE_ARANGO_PREFIX", "youtube_"),
-            graph_name=os.getenv("YOUTUBE_ARANGO_GRAPH", "youtube_knowledge_graph")
+            graph_name=os.getenv("YOUTUBE_ARANGO_GRAPH", "youtube_knowledge_graph"),
+            request_timeout=float(os.getenv("YOUTUBE_ARANGO_TIMEOUT", "10"))
         )
 
         return cls(
@@ -136,7 +154,7 @@ class DatabaseConfig:
             enable_graph_features=os.getenv("YOUTUBE_ENABLE_GRAPH", "true").lower() == "true",
             enable_research_features=os.getenv("YOUTUBE_ENABLE_RESEARCH", "true").lower() == "true",
             cache_enabled=os.getenv("YOUTUBE_CACHE_ENABLED", "true").lower() == "true",
-            cache_ttl=int(os.getenv("YOUTUBE_CACHE_TTL", "3600"))
+            cache_ttl=int(ttl) if (ttl := os.getenv("YOUTUBE_CACHE_TTL")) else None
         )
 
     def get_backend_config(self) -> dict[str, Any]:
@@ -145,20 +163,31 @@ class DatabaseConfig:
             return {
                 'backend': 'sqlite',
                 'sqlite_path': self.sqlite.db_path,
-                **self.sqlite.to_dict()
+                **self.sqlite.to_dict(),
+                **self._cache_config()
             }
         elif self.backend == "arangodb":
             return {
                 'backend': 'arangodb',
-                'arango_config': self.arangodb.to_dict()
+                'arango_config': self.arangodb.to_dict(),
+                **self._cache_config()
             }
         else:  # auto
             return {
                 'backend': 'auto',
                 'sqlite_path': self.sqlite.db_path,
-                'arango_config': self.arangodb.to_dict()
+                **self.sqlite.to_dict(),
+                'arango_config': self.arangodb.to_dict(),
+                **self._cache_config()
             }
 
+    def _cache_config(self) -> dict[str, Any]:
+        """Get the adapter-level cache settings"""
+        config: dict[str, Any] = {'cache_enabled': self.cache_enabled}
+        if self.cache_ttl is not None:
+            config['cache_ttl'] = self.cache_ttl
+        return config
+
     def requires_arangodb(self) -> bool:
         """Check if configuration requires ArangoDB features"""
         return (
@@ -173,6 +202,9 @@ class DatabaseConfig:
 # Global configuration instance
 _config: DatabaseConfig | None = None
 
+# Shared adapter, so its connections are opened once per process
+_adapter: "DatabaseAdapter | None" = None
+
 
 def get_database_config() -> DatabaseConfig:
     """Get or create database configuration"""
@@ -186,14 +218,26 @@ def set_database_config(config: DatabaseConfig):
     """Set database configuration (useful for testing)"""
     global _config
     _config = config
+    reset_database_adapter()
 
 
-def create_database_adapter():
-    """Create a database adapter based on current configuration"""
-    from .database_adapter import DatabaseAdapter
+def create_database_adapter() -> "DatabaseAdapter":
+    """Get or create the database adapter for the current configuration"""
+    global _adapter
+    if _adapter is None:
+        from .database_adapter import DatabaseAdapter
 
-    config = get_database_config()
-    return DatabaseAdapter(config.get_backend_config())
+        config = get_database_config()
+        _adapter = DatabaseAdapter(config.get_backend_config())
+    return _adapter
+
+
+def reset_database_adapter():
+    """Close and discard the shared adapter (useful for testing)"""
+    global _adapter
+    if _adapter is not None:
+        _adapter.close()
+        _adapter = None
 
 
 # Environment variable template
@@ -216,6 +260,7 @@ YOUTUBE_ARANGO_USERNAME=root
 YOUTUBE_ARANGO_PASSWORD=
 YOUTUBE_ARANGO_PREFIX=youtube_
 YOUTUBE_ARANGO_GRAPH=youtube_knowledge_graph
+YOUTUBE_ARANGO_TIMEOUT=10
 
 # Feature Flags
 YOUTUBE_ENABLE_EMBEDDINGS=true
@@ -4,11 +4,14 @@ Module: deepretrieval_optimizer.py
 Description: Implementation of deepretrieval optimizer functionality
 
 This module provides query optimization using DeepRetrieval methodology with
-local Ollama models and optional LoRA adapters for fine-tuning.
+local Ollama models and optional LoRA adapters for fine-tuning. A llama.cpp
+server can be used instead of Ollama by setting `backend="llama.cpp"`.
 
 External Dependencies:
 - ollama: https://github.com/ollama/ollama-python
+- httpx: https://www.python-httpx.org/ (installed with ollama, used for llama.cpp)
 - unsloth (optional): https://github.com/unslothai/unsloth
+- sentence-transformers (optional): https://www.sbert.net/
 
 Example Usage:
 >>> from deepretrieval_optimizer import DeepRetrievalQueryOptimizer
@@ -16,10 +19,14 @@ Example Usage:
 >>> optimizer = DeepRetrievalQueryOptimizer(UnifiedSearchConfig())
 >>> result = optimizer.optimize_query("how to implement RAG")
 >>> print(result["optimized"])
+>>> results = await optimizer.optimize_queries(["explain transformers", "fine-tuning LLMs"])
 """
 
+import asyncio
+import json
 import logging
 import re
+import time
 from typing import Any
 
 from .unified_search_config import UnifiedSearchConfig
@@ -34,6 +41,162 @@ except ImportError:
     OLLAMA_AVAILABLE = False
     logger.warning("Ollama not available, install with: pip install ollama")
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Static instructions, sent verbatim as the system message so the backend can
+# reuse their KV cache across calls; only the user message varies
+_OPTIMIZER_SYSTEM = """You are a search query optimizer for YouTube transcripts.
+Given a user query, generate an optimized search query that will retrieve the most relevant transcripts.
+
+Generate your response in this format:
+<think>
+[Your reasoning about how to improve the query]
+</think>
+<answer>
+[Your optimized query]
+</answer>"""
+
+# Only needed to strip stray tags from replies without an <answer> block
+_TAG_RE = re.compile(r'<[^>]+>')
+# Characters that could break the FTS5 query
+_UNSAFE_QUERY_CHARS = str.maketrans('', '', '<>"')
+
+
+class _OptimizationCache:
+    """
+    Cache of optimization results keyed by normalized query
+    Optionally matches near-duplicate queries by embedding similarity
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024,
+                 semantic_model: str | None = None, threshold: float = 0.92):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self._exact: dict[tuple, tuple[float, dict[str, Any]]] = {}
+
+        # Semantic tier, loaded on first use
+        self._semantic_model = semantic_model
+        self._embedder = None
+        self._vectors = None
+        self._payloads: list[tuple[float, dict[str, Any]]] = []
+
+    @staticmethod
+    def key(model: str, query: str, context: dict | None) -> tuple:
+        """Build the exact-match key for a query"""
+        context_key = json.dumps(context, sort_keys=True, default=str) if context else None
+        return model, ' '.join(query.lower().split()), context_key
+
+    def get(self, key: tuple) -> dict[str, Any] | None:
+        """Look up a cached result, trying an exact match first"""
+        entry = self._exact.get(key)
+        if entry is not None:
+            if entry[0] >= time.monotonic():
+                return entry[1]
+            del self._exact[key]
+
+        # Results optimized with context are only reused for the same context
+        if key[2] is not None or not self._load_embedder() or not self._payloads:
+            return None
+        scores = self._vectors @ self._embed(key[1])
+        best = int(scores.argmax())
+        expires, payload = self._payloads[best]
+        if scores[best] >= self.threshold and expires >= time.monotonic():
+            return payload
+        return None
+
+    def put(self, key: tuple, payload: dict[str, Any]):
+        """Cache a result from the model"""
+        expires = time.monotonic() + self.ttl
+        if len(self._exact) >= self.maxsize:
+            del self._exact[next(iter(self._exact))]
+        self._exact[key] = (expires, payload)
+
+        if key[2] is None and self._load_embedder():
+            import numpy as np
+
+            vector = self._embed(key[1])[np.newaxis]
+            if len(self._payloads) >= self.maxsize:
+                self._payloads.pop(0)
+                self._vectors = self._vectors[1:]
+            self._vectors = vector if self._vectors is None else np.vstack([self._vectors, vector])
+            self._payloads.append((expires, payload))
+
+    def _embed(self, text: str):
+        return self._embedder.encode(text, normalize_embeddings=True)
+
+    def _load_embedder(self) -> bool:
+        """Load the sentence-transformers model for the semantic tier"""
+        if self._embedder is None and self._semantic_model:
+            try:
+                from sentence_transformers import SentenceTransformer
+
+                self._embedder = SentenceTransformer(self._semantic_model)
+            except Exception as e:
+                logger.warning(f"Semantic query cache disabled: {e}")
+                self._semantic_model = None
+        return self._embedder is not None
+
+
+class OllamaBackend:
+    """Chat backend using a local Ollama server"""
+
+    def __init__(self, keep_alive: str | None = None):
+        self.keep_alive = keep_alive
+        self.client = ollama.Client()
+
+    def async_client(self) -> "ollama.AsyncClient":
+        """A new async client; it binds to the loop that first uses it, so open one per loop"""
+        return ollama.AsyncClient()
+
+    def chat(self, model: str, messages: list[dict[str, str]], options: dict[str, Any]) -> str:
+        response = self.client.chat(model=model, messages=messages, options=options,
+                                    keep_alive=self.keep_alive)
+        return response['message']['content']
+
+    async def achat(self, client: "ollama.AsyncClient", model: str, messages: list[dict[str, str]],
+                    options: dict[str, Any]) -> str:
+        response = await client.chat(model=model, messages=messages, options=options,
+                                     keep_alive=self.keep_alive)
+        return response['message']['content']
+
+
+class LlamaCppBackend:
+    """
+    Chat backend using llama.cpp's OpenAI-compatible llama-server
+    Start the server with continuous batching so concurrent requests share it, e.g.
+    llama-server -m model.gguf --ctx-size 2048 --n-gpu-layers 99 --batch-size 512 --cont-batching --parallel 8
+    """
+
+    def __init__(self, base_url: str, timeout: float = 60.0):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.client = httpx.Client(base_url=self.base_url, timeout=timeout)
+
+    def async_client(self) -> "httpx.AsyncClient":
+        """A new async client; its connection pool belongs to one loop, so open one per loop"""
+        return httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout)
+
+    @staticmethod
+    def _payload(model: str, messages: list[dict[str, str]], options: dict[str, Any]) -> dict[str, Any]:
+        # cache_prompt keeps the shared system prefix in the slot's KV cache
+        return {"model": model, "messages": messages, "cache_prompt": True, **options}
+
+    def chat(self, model: str, messages: list[dict[str, str]], options: dict[str, Any]) -> str:
+        response = self.client.post("/v1/chat/completions", json=self._payload(model, messages, options))
+        response.raise_for_status()
+        return response.json()['choices'][0]['message']['content']
+
+    async def achat(self, client: "httpx.AsyncClient", model: str, messages: list[dict[str, str]],
+                    options: dict[str, Any]) -> str:
+        response = await client.post("/v1/chat/completions", json=self._payload(model, messages, options))
+        response.raise_for_status()
+        return response.json()['choices'][0]['message']['content']
+
 
 class DeepRetrievalQueryOptimizer:
     """
@@ -43,25 +206,57 @@ class DeepRetrievalQueryOptimizer:
 
     def __init__(self, config: UnifiedSearchConfig):
         self.config = config
-        if OLLAMA_AVAILABLE:
-            self.ollama_client = ollama.Client()
-        else:
-            self.ollama_client = None
+        self.backend = self._create_backend(config)
+
+        self._cache = None
+        if config.optimization_cache_ttl > 0:
+            self._cache = _OptimizationCache(
+                config.optimization_cache_ttl,
+                semantic_model=config.semantic_cache_model if config.use_semantic_cache else None,
+                threshold=config.semantic_cache_threshold
+            )
 
         # Initialize LoRA if available
         if config.use_lora and config.lora_adapter_path:
             self._load_lora_adapter()
 
+    @staticmethod
+    def _create_backend(config: UnifiedSearchConfig) -> OllamaBackend | LlamaCppBackend | None:
+        """Select the chat backend named by config.backend"""
+        if config.backend == "llama.cpp":
+            if HTTPX_AVAILABLE:
+                return LlamaCppBackend(config.llama_server_url)
+            logger.warning("httpx not available, install with: pip install httpx")
+            return None
+        if config.backend != "ollama":
+            logger.warning(f"Unknown optimizer backend {config.backend!r}, using Ollama")
+        return OllamaBackend(config.model_keep_alive) if OLLAMA_AVAILABLE else None
+
     def _load_lora_adapter(self):
-        """Load Unsloth LoRA adapter for the model"""
+        """
+        Load Unsloth LoRA adapter for the model
+        The base model is quantized QLoRA-style: NF4 weights with double
+        quantization and bfloat16 compute. When serving the merged model through
+        Ollama instead, Q4_K_M is the closest GGUF equivalent (smallest, slight
+        quality loss); Q8_0 roughly doubles memory but is near-lossless
+        """
         try:
+            import torch
+            from transformers import BitsAndBytesConfig
             from unsloth import FastLanguageModel
 
+            bnb_config = BitsAndBytesConfig(
+                load_in_4bit=True,
+                bnb_4bit_quant_type="nf4",
+                bnb_4bit_use_double_quant=True,
+                bnb_4bit_compute_dtype=torch.bfloat16
+            )
+
             # Load base model with LoRA
             self.model, self.tokenizer = FastLanguageModel.from_pretrained(
                 model_name=self.config.ollama_model,
                 max_seq_length=2048,
-                load_in_4bit=True,
+                quantization_config=bnb_config,
                 lora_path=self.config.lora_adapter_path
             )
             logger.info(f"Loaded LoRA adapter from {self.config.lora_adapter_path}")
@@ -73,41 +268,108 @@ class DeepRetrievalQueryOptimizer:
         Optimize query using DeepRetrieval methodology
         Returns optimized query with reasoning
         """
-        if not OLLAMA_AVAILABLE or not self.ollama_client:
-            # Fallback to simple optimization
-            return {
-                "original": user_query,
-                "optimized": user_query + " tutorial implementation example",
-                "reasoning": "Basic optimization (Ollama not available)"
-            }
+        if not self.backend:
+            return self._basic_optimization(user_query)
+
+        cache_key = self._cache.key(self.config.ollama_model, user_query, context) if self._cache else None
+        if cache_key:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return {**cached, "original": user_query}
 
         # Build prompt with DeepRetrieval structure
-        prompt = self._build_optimization_prompt(user_query, context)
+        messages = self._build_optimization_messages(user_query, context)
 
         try:
-            # Use Ollama for local inference
-            response = self.ollama_client.chat(
-                model=self.config.ollama_model,
-                messages=[{"role": "user", "content": prompt}],
-                options={"temperature": 0.7}
-            )
+            # Use the local model for inference
+            response = self.backend.chat(self.config.ollama_model, messages, {"temperature": 0.7})
 
             # Parse response with reasoning
-            parsed = self._parse_optimization_response(response['message']['content'])
-            parsed["original"] = user_query  # Set original query
-            return parsed
+            parsed = self._parse_optimization_response(response)
+            if cache_key:
+                self._cache.put(cache_key, parsed)
+            return {**parsed, "original": user_query}
 
         except Exception as e:
             logger.error(f"Query optimization failed: {e}")
-            # Fallback to original query
-            return {
-                "original": user_query,
-                "optimized": user_query,
-                "reasoning": "Optimization failed, using original query"
-            }
+            return self._failed_optimization(user_query)
+
+    async def optimize_queries(self, user_queries: list[str],
+                               context: dict | None = None) -> list[dict[str, Any]]:
+        """
+        Optimize several queries concurrently
+        All prompts are submitted at once so the backend can schedule them together
+        """
+        if not self.backend:
+            return [self._basic_optimization(query) for query in user_queries]
+
+        # Serve cached queries directly and only send the misses to the model
+        results: list[dict[str, Any] | None] = [None] * len(user_queries)
+        pending = []
+        for index, query in enumerate(user_queries):
+            cache_key = self._cache.key(self.config.ollama_model, query, context) if self._cache else None
+            cached = self._cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                results[index] = {**cached, "original": query}
+            else:
+                pending.append((index, query, cache_key))
+
+        if not pending:
+            return results
+
+        # A fresh client per call: each optimize_queries_sync runs its own loop
+        async with self.backend.async_client() as client:
+            responses = await asyncio.gather(*(
+                self.backend.achat(
+                    client,
+                    self.config.ollama_model,
+                    self._build_optimization_messages(query, context),
+                    {"temperature": 0.7}
+                )
+                for _, query, _ in pending
+            ), return_exceptions=True)
+
+        for (index, query, cache_key), response in zip(pending, responses):
+            if isinstance(response, Exception):
+                logger.error(f"Query optimization failed: {response}")
+                results[index] = self._failed_optimization(query)
+                continue
+            parsed = self._parse_optimization_response(response)
+            if cache_key:
+                self._cache.put(cache_key, parsed)
+            results[index] = {**parsed, "original": query}
+        return results
+
+    def optimize_queries_sync(self, user_queries: list[str],
+                              context: dict | None = None) -> list[dict[str, Any]]:
+        """Synchronous wrapper around optimize_queries"""
+        return asyncio.run(self.optimize_queries(user_queries, context))
+
+    def _basic_optimization(self, user_query: str) -> dict[str, Any]:
+        """Fallback to simple optimization when no model backend is available"""
+        return {
+            "original": user_query,
+            "optimized": user_query + " tutorial implementation example",
+            "reasoning": "Basic optimization (Ollama not available)"
+        }
+
+    def _failed_optimization(self, user_query: str) -> dict[str, Any]:
+        """Fallback to the original query when the model call fails"""
+        return {
+            "original": user_query,
+            "optimized": user_query,
+            "reasoning": "Optimization failed, using original query"
+        }
+
+    def _build_optimization_messages(self, query: str, context: dict = None) -> list[dict[str, str]]:
+        """Build chat messages: the static system prompt, then the query"""
+        return [
+            {"role": "system", "content": _OPTIMIZER_SYSTEM},
+            {"role": "user", "content": self._build_optimization_prompt(query, context)}
+        ]
 
     def _build_optimization_prompt(self, query: str, context: dict = None) -> str:
-        """Build prompt following DeepRetrieval format"""
+        """Build the variable part of the DeepRetrieval prompt"""
         context_str = ""
         if context:
             if "previous_queries" in context:
@@ -115,42 +377,39 @@ class DeepRetrievalQueryOptimizer:
             if "channel_focus" in context:
                 context_str += f"\nChannel focus: {context['channel_focus']}"
 
-        return f"""You are a search query optimizer for YouTube transcripts.
-Given a user query, generate an optimized search query that will retrieve the most relevant transcripts.
-
-User query: "{query}"{context_str}
+        return f'User query: "{query}"{context_str}'
 
-Generate your response in this format:
-<think>
-[Your reasoning about how to improve the query]
-</think>
-<answer>
-[Your optimized query]
-</answer>"""
+    @staticmethod
+    def _tag_body(response: str, open_tag: str, close_tag: str) -> str | None:
+        """Return the text between the first open_tag and the next close_tag, if any"""
+        start = response.find(open_tag)
+        if start < 0:
+            return None
+        start += len(open_tag)
+        end = response.find(close_tag, start)
+        return response[start:end] if end >= 0 else None
 
     def _parse_optimization_response(self, response: str) -> dict[str, Any]:
         """Parse response with reasoning tags"""
         # Extract reasoning
-        think_match = re.search(r'<think>(.*?)</think>', response, re.DOTALL)
-        reasoning = think_match.group(1).strip() if think_match else ""
+        reasoning = self._tag_body(response, '<think>', '</think>')
+        reasoning = reasoning.strip() if reasoning is not None else ""
 
         # Extract optimized query
-        answer_match = re.search(r'<answer>(.*?)</answer>', response, re.DOTALL)
-        if answer_match:
-            optimized = answer_match.group(1).strip()
+        answer = self._tag_body(response, '<answer>', '</answer>')
+        if answer is not None:
             # Take only the first line if multiple lines
-            optimized = optimized.split('\n')[0].strip()
+            optimized = answer.strip().partition('\n')[0].strip()
         else:
             # If no tags, clean the response
-            optimized = response.strip()
             # Remove any XML tags that might be in the response
-            optimized = re.sub(r'<[^>]+>', '', optimized)
+            optimized = _TAG_RE.sub('', response.strip())
             # Take only the first line
-            optimized = optimized.split('\n')[0].strip()
+            optimized = optimized.partition('\n')[0].strip()
 
         # Clean up the optimized query for FTS5
         # Remove special characters that could break SQL
-        optimized = optimized.replace('<', '').replace('>', '').replace('"', '')
+        optimized = optimized.translate(_UNSAFE_QUERY_CHARS)
 
         return {
             "optimized": optimized,
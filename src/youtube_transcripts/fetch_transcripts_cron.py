@@ -19,6 +19,7 @@ Example Usage:
 """
 
 # youtube_transcripts/fetch_transcripts_cron.py
+import asyncio
 import sqlite3
 import os
 from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
@@ -26,7 +27,7 @@ from pytube import Channel
 from datetime import datetime, timedelta
 import sys
 import time
-from core.database import initialize_database, check_transcript_exists, store_transcript, cleanup_old_transcripts
+from core.database import initialize_database, check_transcript_exists, add_transcripts, cleanup_old_transcripts
 from core.transcript import get_channel_videos, get_transcript, enhance_transcript, parse_date_cutoff
 
 # Configuration
@@ -35,6 +36,19 @@ CHANNEL_URLS = [
     "https://www.youtube.com/@TrelisResearch",
 ]
 DATE_CUTOFF = "1 month"
+# Transcript requests in flight at once; each is a network round-trip
+FETCH_CONCURRENCY = 16
+
+async def fetch_one(sem, video_id, title, publish_date):
+    """Fetch one transcript on a worker thread, bounded by sem"""
+    async with sem:
+        transcript = await asyncio.to_thread(get_transcript, video_id)
+    return video_id, title, publish_date, transcript
+
+async def fetch_all(videos):
+    """Fetch transcripts for (video_id, title, publish_date) tuples concurrently"""
+    sem = asyncio.Semaphore(FETCH_CONCURRENCY)
+    return await asyncio.gather(*[fetch_one(sem, *video) for video in videos])
 
 def main():
     """Fetch and store transcripts for cron execution."""
@@ -46,32 +60,47 @@ def main():
     deleted = cleanup_old_transcripts(max_age_months=12)
     print(f"Deleted {deleted} transcripts older than 12 months.")
     
-    # Fetch transcripts, skipping summaries to reduce API costs
-    for channel_url in CHANNEL_URLS:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM video_metadata WHERE channel_name = ?", (Channel(channel_url).channel_name or "Unknown Channel",))
-        transcript_count = cursor.fetchone()[0]
-        conn.close()
-        
-        if transcript_count > 0:
-            print(f"Found {transcript_count} existing transcripts for channel {channel_url}. Checking for new videos.")
-        
-        videos = get_channel_videos(channel_url, date_cutoff)
-        channel_name = Channel(channel_url).channel_name or "Unknown Channel"
-        for video_id, title, publish_date in videos:
-            if check_transcript_exists(video_id):
-                print(f"Skipping existing video: {title}")
-                continue
+    # One connection serves the whole run; WAL lets readers continue while it writes
+    conn = sqlite3.connect(DB_PATH)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+
+    try:
+        # Fetch transcripts, skipping summaries to reduce API costs
+        for channel_url in CHANNEL_URLS:
+            # Resolving the channel name fetches the channel page, so do it once
+            channel_name = Channel(channel_url).channel_name or "Unknown Channel"
+
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM video_metadata WHERE channel_name = ?", (channel_name,))
+            transcript_count = cursor.fetchone()[0]
             
-            transcript = get_transcript(video_id)
-            if transcript:
-                summary = "Summary skipped for cron run."
-                enhanced_transcript = enhance_transcript(transcript)
-                store_transcript(video_id, title, channel_name, publish_date, transcript, summary, enhanced_transcript)
-                print(f"Stored transcript for video: {title}")
-            else:
-                print(f"No transcript available for video: {title}")
+            if transcript_count > 0:
+                print(f"Found {transcript_count} existing transcripts for channel {channel_url}. Checking for new videos.")
+            
+            # Rows are written in one transaction once the channel is done
+            pending = []
+            new_videos = []
+            for video_id, title, publish_date in get_channel_videos(channel_url, date_cutoff):
+                if check_transcript_exists(video_id, conn=conn):
+                    print(f"Skipping existing video: {title}")
+                else:
+                    new_videos.append((video_id, title, publish_date))
+
+            for video_id, title, publish_date, transcript in asyncio.run(fetch_all(new_videos)):
+                if transcript:
+                    summary = "Summary skipped for cron run."
+                    enhanced_transcript = enhance_transcript(transcript)
+                    pending.append((video_id, title, channel_name, publish_date, transcript, summary, enhanced_transcript))
+                    print(f"Fetched transcript for video: {title}")
+                else:
+                    print(f"No transcript available for video: {title}")
+
+            add_transcripts(pending, conn=conn)
+            print(f"Stored {len(pending)} transcripts for channel {channel_name}")
+    finally:
+        conn.close()
 
 if __name__ == "__main__":
     main()
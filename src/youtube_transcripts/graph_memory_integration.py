@@ -8,6 +8,9 @@ management, including entity extraction and relationship discovery between trans
 
 External Dependencies:
 - arangodb (optional): Custom ArangoDB integration from companion project
+- hyperscan (optional): SIMD matching of known organizations
+- pyahocorasick (optional): Single-pass matching of known organizations
+- numpy (optional): Vectorized prefilter for entity match positions
 
 Example Usage:
 >>> from graph_memory_integration import GraphMemoryIntegration
@@ -18,8 +21,13 @@ Example Usage:
 [{'name': 'Elon Musk', 'type': 'person', ...}, {'name': 'GPT-4', 'type': 'technical_term', ...}]
 """
 
+import asyncio
+import hashlib
 import logging
 import re
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
@@ -39,6 +47,171 @@ except ImportError as e:
     ARANGO_AVAILABLE = False
     logger.warning(f"ArangoDB not available: {e}, graph memory features disabled")
 
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Entity extraction patterns, each a named group tried at every word that
+# starts with a capital letter, so the transcript is scanned only once.
+# Groups sit in optional lookaheads so patterns can overlap, e.g. GPT-4 is
+# also seen by the acronym and versioned-term patterns.
+_ENTITY_PATTERNS = {
+    # People: Look for capitalized names
+    'person': r'[A-Z][a-z]+ [A-Z][a-z]+',
+    # Organizations: Look for Inc., Corp., Company, etc.
+    'organization': r'[A-Z][A-Za-z\s&]+(?:Inc|Corp|Company|LLC|Ltd|Foundation|Institute|University)',
+    # Technical terms: Capitalized words, acronyms, or terms with numbers
+    'acronym': r'[A-Z]{2,}',  # Acronyms like PPO, CNN
+    'camel_case': r'[A-Z][a-z]+(?:[A-Z][a-z]+)+',  # CamelCase like AlphaGo
+    'gpt_version': r'GPT-\d+',  # GPT versions
+    'versioned': r'[A-Z]+[a-z]*-\d+',  # Other versioned terms
+}
+_TECH_KINDS = ('acronym', 'camel_case', 'gpt_version', 'versioned')
+
+# Entity types extract_entities_from_transcript can produce, and the
+# patterns each one needs
+ENTITY_TYPES = ('youtube_channel', 'person', 'organization', 'technical_term', 'topic')
+_ENTITY_TYPE_KINDS = {
+    'person': ('person',),
+    'organization': ('organization',),
+    'technical_term': _TECH_KINDS,
+}
+
+
+def _compile_entity_regex(kinds: Iterable[str]) -> re.Pattern:
+    """Combine the patterns for the given kinds into one regex"""
+    return re.compile(r'\b(?=[A-Z])' + ''.join(
+        rf'(?:(?=(?P<{kind}>{_ENTITY_PATTERNS[kind]})\b))?' for kind in kinds
+    ))
+
+
+_ENTITY_RE = _compile_entity_regex(_ENTITY_PATTERNS)
+
+# Well-known tech organizations matched verbatim
+_KNOWN_ORGS = ('OpenAI', 'Microsoft', 'Google', 'Facebook', 'Amazon', 'Apple', 'DeepMind',
+               'Google DeepMind', 'MIT', 'Stanford', 'Facebook AI Research', 'Microsoft Research')
+
+# One Hyperscan database or automaton finds every known organization in a
+# single pass over the text. Hyperscan is preferred when both are installed.
+_ORG_HS_DB = None
+if HYPERSCAN_AVAILABLE:
+    _ORG_HS_DB = hyperscan.Database()
+    _ORG_HS_DB.compile(
+        expressions=[re.escape(org).encode() for org in _KNOWN_ORGS],
+        ids=list(range(len(_KNOWN_ORGS))),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(_KNOWN_ORGS)
+    )
+
+_ORG_AUTOMATON = None
+if AHOCORASICK_AVAILABLE and _ORG_HS_DB is None:
+    _ORG_AUTOMATON = ahocorasick.Automaton()
+    for _org in _KNOWN_ORGS:
+        _ORG_AUTOMATON.add_word(_org, _org)
+    _ORG_AUTOMATON.make_automaton()
+
+
+@dataclass(slots=True)
+class Entity:
+    """An extracted entity, converted to a dict only when returned to callers"""
+    name: str
+    type: str
+    source: str = "transcript"
+    confidence: float = 0.7
+    properties: dict[str, Any] | None = None  # Replaces source/confidence when set, e.g. for channels
+
+    def to_dict(self) -> dict[str, Any]:
+        properties = self.properties
+        if properties is None:
+            properties = {"source": self.source, "confidence": self.confidence}
+        return {"name": self.name, "type": self.type, "properties": properties}
+
+
+# Maps separators to spaces when normalizing names for deduplication
+_DEDUP_TABLE = str.maketrans('-_', '  ')
+
+
+def _first_indices(keys: list[tuple]) -> list[int]:
+    """Return the index of the first occurrence of each key, in first-seen order"""
+    # Walking backwards leaves the earliest index as each key's value
+    first = dict(zip(reversed(keys), range(len(keys) - 1, -1, -1)))
+    return [first[key] for key in dict.fromkeys(keys)]
+
+
+def _dedupe(entities: list[Entity], keys: list[tuple]) -> list[Entity]:
+    """Keep the first entity for each key, in first-seen order"""
+    return [entities[i] for i in _first_indices(keys)]
+
+
+def _normalize_entity_name(name: str) -> str:
+    """Normalize an entity name for cross-transcript matching"""
+    normalized = name.lower().strip()
+    # Remove common variations
+    normalized = normalized.replace('inc.', '').replace('corp.', '')
+    normalized = normalized.replace('company', '').replace('foundation', '')
+    return normalized.strip()
+
+
+# Characters prefiltered per step, keeping the numpy buffers cache-sized
+_SCAN_CHUNK = 65536
+
+
+def _iter_entity_matches(text: str, pattern: re.Pattern = _ENTITY_RE,
+                         chunk: int = _SCAN_CHUNK) -> Iterator[re.Match]:
+    """
+    Yield the same matches as pattern.finditer(text) for an entity regex
+    Every match starts at an uppercase ASCII letter, so numpy finds those
+    positions chunk by chunk and the regex is only tried there. Matching
+    always runs against the full text, so matches can cross chunk boundaries.
+    """
+    if not NUMPY_AVAILABLE:
+        yield from pattern.finditer(text)
+        return
+
+    match_at = pattern.match
+    for offset in range(0, len(text), chunk):
+        window = text[offset:offset + chunk]
+        # One array element per character, so array indices are string offsets
+        if window.isascii():
+            codes = np.frombuffer(window.encode('ascii'), np.uint8)
+        else:
+            codes = np.frombuffer(window.encode('utf-32-le'), np.uint32)
+        # Unsigned wraparound turns the A-Z range check into a single comparison
+        candidates = np.flatnonzero((codes - 0x41) <= 25)
+
+        for pos in candidates.tolist():
+            match = match_at(text, offset + pos)
+            if match is not None:
+                yield match
+
+
+def _find_known_orgs(text: str) -> list[str]:
+    """Return the known organizations mentioned in text, in _KNOWN_ORGS order"""
+    if _ORG_HS_DB is not None:
+        found_ids = set()
+        _ORG_HS_DB.scan(
+            text.encode('utf-8', 'replace'),
+            match_event_handler=lambda org_id, start, end, flags, context: found_ids.add(org_id)
+        )
+        return [org for org_id, org in enumerate(_KNOWN_ORGS) if org_id in found_ids]
+    if _ORG_AUTOMATON is not None:
+        found = {org for _, org in _ORG_AUTOMATON.iter(text)}
+        return [org for org in _KNOWN_ORGS if org in found]
+    return [org for org in _KNOWN_ORGS if org in text]
+
 
 class GraphMemoryIntegration:
     """
@@ -47,12 +220,18 @@ class GraphMemoryIntegration:
 
     def __init__(self, config: UnifiedSearchConfig):
         self.config = config
+        self._set_entity_types(config.entity_types)
         if ARANGO_AVAILABLE:
             try:
                 # Initialize ArangoDB connection
                 client = connect_arango()
                 self.db = ensure_database(client)
                 self.memory_agent = MemoryAgent(self.db)
+                if not self.db.has_collection('entities'):
+                    self.db.create_collection('entities')
+                # Writes are queued as server-side async jobs so searches
+                # don't wait on them
+                self.async_db = self.db.begin_async_execution(return_result=False)
                 self.enabled = True
             except Exception as e:
                 logger.warning(f"Could not initialize ArangoDB: {e}")
@@ -60,11 +239,24 @@ class GraphMemoryIntegration:
         else:
             self.enabled = False
 
+    def _set_entity_types(self, entity_types: list[str] | None):
+        """Build the extraction regex from only the enabled entity types"""
+        enabled = set(entity_types) if entity_types is not None else set(ENTITY_TYPES)
+        unknown = enabled.difference(ENTITY_TYPES)
+        if unknown:
+            logger.warning(f"Ignoring unknown entity types: {sorted(unknown)}")
+        self.entity_types = frozenset(enabled.intersection(ENTITY_TYPES))
+        kinds = [
+            kind for entity_type in ENTITY_TYPES if entity_type in self.entity_types
+            for kind in _ENTITY_TYPE_KINDS.get(entity_type, ())
+        ]
+        self._entity_re: re.Pattern | None = _compile_entity_regex(kinds) if kinds else None
+
     def store_search_interaction(
         self,
         query: str,
         results: list[dict],
-        optimized_query: str = None
+        optimized_query: str | None = None
     ) -> str | None:
         """Store search interaction in memory bank"""
         if not self.enabled:
@@ -85,12 +277,34 @@ class GraphMemoryIntegration:
 
             # Extract and store entities
             entities = self._extract_entities_from_results(results)
+            self._store_entities(entities)
 
             return memory_id
         except Exception as e:
             logger.error(f"Failed to store search interaction: {e}")
             return None
 
+    def _store_entities(self, entities: list[dict[str, Any]]):
+        """Queue all entities as one bulk upsert"""
+        if not entities:
+            return
+
+        docs = [
+            {
+                # Same key scheme as YouTubeTranscriptGraph so both writers share documents
+                '_key': hashlib.md5(f"{entity['name']}_{entity['type']}".encode()).hexdigest()[:12],
+                'name': entity['name'],
+                'type': entity['type'],
+                'properties': entity['properties']
+            }
+            for entity in entities
+        ]
+        self.async_db.collection('entities').import_bulk(docs, on_duplicate='update')
+
+    async def get_query_context_async(self, user_id: str = "default") -> dict[str, Any]:
+        """Get context from previous searches without blocking the event loop"""
+        return await asyncio.to_thread(self.get_query_context, user_id)
+
     def get_query_context(self, user_id: str = "default") -> dict[str, Any]:
         """Get context from previous searches"""
         if not self.enabled:
@@ -108,7 +322,7 @@ class GraphMemoryIntegration:
             logger.error(f"Failed to get query context: {e}")
             return {}
 
-    def extract_entities_from_transcript(self, transcript_text: str, metadata: dict[str, Any] = None) -> list[dict[str, Any]]:
+    def extract_entities_from_transcript(self, transcript_text: str, metadata: dict[str, Any] | None = None) -> list[dict[str, Any]]:
         """
         Extract named entities from transcript text using NLP.
         Identifies people, organizations, technical terms, and concepts.
@@ -116,96 +330,94 @@ class GraphMemoryIntegration:
         if not self.enabled:
             return []
 
-        entities = []
-        metadata = metadata or {}
+        return [entity.to_dict() for entity in self._extract_entities(transcript_text, metadata)]
 
-        # Extract channel as primary entity
-        if 'channel_name' in metadata:
-            entities.append({
-                "name": metadata['channel_name'],
-                "type": "youtube_channel",
-                "properties": {
-                    "url": f"https://youtube.com/@{metadata['channel_name']}",
-                    "video_count": metadata.get('video_count', 1)
-                }
-            })
+    def _extract_entities(self, transcript_text: str, metadata: dict[str, Any] | None = None) -> list[Entity]:
+        """Extract deduplicated entities from a transcript"""
+        metadata = metadata or {}
+        entity_types = self.entity_types
 
-        # Simple entity extraction patterns
-        # People: Look for capitalized names
-        people_pattern = r'\b([A-Z][a-z]+ [A-Z][a-z]+)\b'
-        for match in re.finditer(people_pattern, transcript_text):
-            entities.append({
-                "name": match.group(1),
-                "type": "person",
-                "properties": {"source": "transcript", "confidence": 0.7}
-            })
+        # Matches are collected as parallel columns; Entity objects are only
+        # built for the entities that survive deduplication
+        names: list[str] = []
+        types: list[str] = []
+        sources: list[str] = []
+        confidences: list[float] = []
 
-        # Organizations: Look for Inc., Corp., Company, etc. OR known tech companies
-        org_pattern = r'\b([A-Z][A-Za-z\s&]+(?:Inc|Corp|Company|LLC|Ltd|Foundation|Institute|University))\b'
-        known_orgs = ['OpenAI', 'Microsoft', 'Google', 'Facebook', 'Amazon', 'Apple', 'DeepMind',
-                      'Google DeepMind', 'MIT', 'Stanford', 'Facebook AI Research', 'Microsoft Research']
-
-        # First check for known organizations
-        for org in known_orgs:
-            if org in transcript_text:
-                entities.append({
-                    "name": org,
-                    "type": "organization",
-                    "properties": {"source": "transcript", "confidence": 0.9}
-                })
+        # Extract channel as primary entity
+        has_channel = 'channel_name' in metadata and 'youtube_channel' in entity_types
+        if has_channel:
+            names.append(metadata['channel_name'])
+            types.append("youtube_channel")
+            sources.append("")
+            confidences.append(0.5)
+
+        # Single pass over the transcript. A kind's match only counts if it
+        # starts after that kind's previous match, as separate finditer
+        # scans per pattern would report them.
+        matches: dict[str, list[str]] = {kind: [] for kind in _ENTITY_PATTERNS}
+        if self._entity_re is not None:
+            last_end = dict.fromkeys(_ENTITY_PATTERNS, 0)
+            for match in _iter_entity_matches(transcript_text, self._entity_re):
+                start = match.start()
+                for kind, name in match.groupdict().items():
+                    if name is not None and start >= last_end[kind]:
+                        last_end[kind] = start + len(name)
+                        matches[kind].append(name)
+
+        for name in matches['person']:
+            names.append(name)
+            types.append("person")
+            sources.append("transcript")
+            confidences.append(0.7)
+
+        # Organizations: first check for known tech companies
+        for org in _find_known_orgs(transcript_text) if 'organization' in entity_types else ():
+            names.append(org)
+            types.append("organization")
+            sources.append("transcript")
+            confidences.append(0.9)
 
         # Then check for pattern-based organizations
-        for match in re.finditer(org_pattern, transcript_text):
-            entities.append({
-                "name": match.group(1).strip(),
-                "type": "organization",
-                "properties": {"source": "transcript", "confidence": 0.8}
-            })
-
-        # Technical terms: Capitalized words, acronyms, or terms with numbers
-        tech_patterns = [
-            r'\b([A-Z]{2,})\b',  # Acronyms like PPO, CNN
-            r'\b([A-Z][a-z]+(?:[A-Z][a-z]+)+)\b',  # CamelCase like AlphaGo
-            r'\b(GPT-\d+)\b',  # GPT versions
-            r'\b([A-Z]+[a-z]*-\d+)\b',  # Other versioned terms
-        ]
-
-        for pattern in tech_patterns:
-            for match in re.finditer(pattern, transcript_text):
-                term = match.group(1)
+        for name in matches['organization']:
+            names.append(name.strip())
+            types.append("organization")
+            sources.append("transcript")
+            confidences.append(0.8)
+
+        # Technical terms
+        for kind in _TECH_KINDS:
+            for term in matches[kind]:
                 if len(term) > 2:  # Skip very short acronyms
-                    entities.append({
-                        "name": term,
-                        "type": "technical_term",
-                        "properties": {"source": "transcript", "confidence": 0.6}
-                    })
+                    names.append(term)
+                    types.append("technical_term")
+                    sources.append("transcript")
+                    confidences.append(0.6)
 
         # Topics from video metadata
-        if 'title' in metadata:
+        if 'title' in metadata and 'topic' in entity_types:
             # Extract key terms from title
             title_terms = metadata['title'].split()
             for term in title_terms:
                 if len(term) > 4 and term[0].isupper():
-                    entities.append({
-                        "name": term,
-                        "type": "topic",
-                        "properties": {"source": "video_title", "confidence": 0.9}
-                    })
+                    names.append(term)
+                    types.append("topic")
+                    sources.append("video_title")
+                    confidences.append(0.9)
 
         # Deduplicate entities by normalized name and type
-        seen = set()
-        unique_entities = []
-
-        # Normalize entity name for deduplication
-        def normalize_name(name):
-            return name.lower().strip().replace('-', ' ').replace('_', ' ')
+        keys = [(name.lower().strip().translate(_DEDUP_TABLE), entity_type)
+                for name, entity_type in zip(names, types)]
 
-        for entity in entities:
-            normalized_name = normalize_name(entity['name'])
-            key = (normalized_name, entity['type'])
-            if key not in seen:
-                seen.add(key)
-                unique_entities.append(entity)
+        unique_entities = [
+            Entity(names[i], types[i], sources[i], confidences[i]) for i in _first_indices(keys)
+        ]
+        if has_channel:
+            # The channel is always first and never a duplicate
+            unique_entities[0].properties = {
+                "url": f"https://youtube.com/@{names[0]}",
+                "video_count": metadata.get('video_count', 1)
+            }
 
         return unique_entities
 
@@ -223,88 +435,107 @@ class GraphMemoryIntegration:
         if not self.enabled:
             return []
 
-        relationships = []
-
-        # Extract entities from both transcripts
-        entities1 = self.extract_entities_from_transcript(
-            transcript1.get('content', ''),
-            transcript1
-        )
-        entities2 = self.extract_entities_from_transcript(
-            transcript2.get('content', ''),
-            transcript2
+        return self._relationships_between(
+            self._relationship_profile(transcript1),
+            self._relationship_profile(transcript2)
         )
 
-        # Find shared entities with normalized matching
-        def normalize_entity_name(name):
-            # Normalize for matching: lowercase, strip, remove special chars
-            normalized = name.lower().strip()
-            # Remove common variations
-            normalized = normalized.replace('inc.', '').replace('corp.', '')
-            normalized = normalized.replace('company', '').replace('foundation', '')
-            return normalized.strip()
-
-        # Group entities by normalized name for comparison
-        entities1_by_name = {}
-        for e in entities1:
-            norm_name = normalize_entity_name(e['name'])
-            if norm_name not in entities1_by_name:
-                entities1_by_name[norm_name] = []
-            entities1_by_name[norm_name].append(e)
-
-        # Find shared entities
-        shared_entities = []
-        for e2 in entities2:
-            norm_name = normalize_entity_name(e2['name'])
-            if norm_name in entities1_by_name:
-                # Found a shared entity
-                for e1 in entities1_by_name[norm_name]:
-                    shared_entities.append({
-                        "entity1": e1,
-                        "entity2": e2,
-                        "normalized_name": norm_name
-                    })
-
-        # Create relationships for shared entities
-        for shared in shared_entities:
-            relationships.append({
-                "type": f"shared_{shared['entity1']['type']}",
-                "entity": shared['entity1']['name'],
-                "properties": {
-                    "entity_type": shared['entity1']['type'],
-                    "confidence": min(
-                        shared['entity1']['properties'].get('confidence', 0.5),
-                        shared['entity2']['properties'].get('confidence', 0.5)
-                    )
-                }
-            })
+    def build_all_relationships(self, transcripts: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Extract relationships for every pair of transcripts.
+        Entities and dates are extracted once per transcript rather than once per pair.
+        """
+        if not self.enabled:
+            return []
 
-        # Temporal relationships
-        if 'published_at' in transcript1 and 'published_at' in transcript2:
+        profiles = [self._relationship_profile(transcript) for transcript in transcripts]
+
+        pairs = []
+        for i, profile1 in enumerate(profiles):
+            for j in range(i + 1, len(profiles)):
+                relationships = self._relationships_between(profile1, profiles[j])
+                if relationships:
+                    pairs.append({
+                        "source_index": i,
+                        "target_index": j,
+                        "relationships": relationships
+                    })
+        return pairs
+
+    def _relationship_profile(self, transcript: dict[str, Any]) -> dict[str, Any]:
+        """Precompute what relationship extraction needs from one transcript"""
+        entities = self._extract_entities(transcript.get('content', ''), transcript)
+
+        # Interned normalized name of each entity, plus the entities grouped
+        # by name; pairs with no name in common are ruled out by one set
+        # intersection before any entity is visited
+        names = [sys.intern(_normalize_entity_name(entity.name)) for entity in entities]
+        by_name: dict[str, list[Entity]] = {}
+        for name, entity in zip(names, entities):
+            by_name.setdefault(name, []).append(entity)
+
+        published = None
+        if 'published_at' in transcript:
             try:
-                date1 = datetime.fromisoformat(transcript1['published_at'].replace('Z', '+00:00'))
-                date2 = datetime.fromisoformat(transcript2['published_at'].replace('Z', '+00:00'))
-
-                days_apart = abs((date2 - date1).days)
+                published = datetime.fromisoformat(transcript['published_at'].replace('Z', '+00:00'))
+            except Exception as e:
+                logger.debug(f"Could not parse dates: {e}")
 
-                if days_apart < 7:
-                    relationships.append({
-                        "type": "temporal_proximity",
-                        "properties": {
-                            "days_apart": days_apart,
-                            "relationship": "same_week"
-                        }
-                    })
-                elif days_apart < 30:
+        return {
+            "transcript": transcript,
+            "entities": entities,
+            "names": names,
+            "name_set": frozenset(by_name),
+            "by_name": by_name,
+            "published": published
+        }
+
+    def _relationships_between(self, profile1: dict[str, Any],
+                               profile2: dict[str, Any]) -> list[dict[str, Any]]:
+        """Build the relationships between two precomputed transcript profiles"""
+        relationships = []
+        transcript1 = profile1['transcript']
+        transcript2 = profile2['transcript']
+
+        # Create relationships for shared entities: every entity of the
+        # first transcript whose name matches one in the second, in the
+        # second transcript's order
+        shared = profile1['name_set'] & profile2['name_set']
+        if shared:
+            entities1_by_name = profile1['by_name']
+            for e2, name in zip(profile2['entities'], profile2['names']):
+                if name not in shared:
+                    continue
+                for e1 in entities1_by_name[name]:
                     relationships.append({
-                        "type": "temporal_proximity",
+                        "type": f"shared_{e1.type}",
+                        "entity": e1.name,
                         "properties": {
-                            "days_apart": days_apart,
-                            "relationship": "same_month"
+                            "entity_type": e1.type,
+                            "confidence": min(e1.confidence, e2.confidence)
                         }
                     })
-            except Exception as e:
-                logger.debug(f"Could not parse dates: {e}")
+
+        # Temporal relationships
+        if profile1['published'] is not None and profile2['published'] is not None:
+            days_apart = abs((profile2['published'] - profile1['published']).days)
+
+            if days_apart < 7:
+                relationships.append({
+                    "type": "temporal_proximity",
+                    "properties": {
+                        "days_apart": days_apart,
+                        "relationship": "same_week"
+                    }
+                })
+            elif days_apart < 30:
+                relationships.append({
+                    "type": "temporal_proximity",
+                    "properties": {
+                        "days_apart": days_apart,
+                        "relationship": "same_month"
+                    }
+                })
 
         # Channel relationship
         if transcript1.get('channel_name') == transcript2.get('channel_name'):
@@ -319,11 +550,13 @@ class GraphMemoryIntegration:
 
     def _extract_entities_from_results(self, results: list[dict]) -> list[dict[str, Any]]:
         """Extract entities from search results"""
-        all_entities = []
+        if not self.enabled:
+            return []
 
+        all_entities: list[Entity] = []
         for result in results[:10]:  # Limit to top 10 results
             if 'content' in result:
-                entities = self.extract_entities_from_transcript(
+                entities = self._extract_entities(
                     result['content'][:1000],  # Limit text for performance
                     {
                         'channel_name': result.get('channel_name'),
@@ -334,15 +567,8 @@ class GraphMemoryIntegration:
                 all_entities.extend(entities)
 
         # Deduplicate
-        seen = set()
-        unique = []
-        for entity in all_entities:
-            key = (entity['name'].lower(), entity['type'])
-            if key not in seen:
-                seen.add(key)
-                unique.append(entity)
-
-        return unique
+        unique = _dedupe(all_entities, [(entity.name.lower(), entity.type) for entity in all_entities])
+        return [entity.to_dict() for entity in unique]
 
 
 if __name__ == "__main__":
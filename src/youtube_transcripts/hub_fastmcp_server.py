@@ -10,24 +10,191 @@ providing orchestration capabilities across all Granger spoke modules.
 from fastmcp import FastMCP
 from typing import Dict, Any, List, Optional
 import asyncio
+import functools
 import json
+import os
+import sys
+import time
+import weakref
+from datetime import datetime, timezone
 from pathlib import Path
 
+# FastMCP builds tool schemas with pydantic, which needs typing_extensions'
+# TypedDict before Python 3.12
+from pydantic import ConfigDict
+from typing_extensions import TypedDict
+
 # Note: In production, these would be proper imports
 # from .hub_prompts import register_all_prompts
 # from .prompts import get_prompt_registry
-# from ..core.module_communicator import ModuleCommunicator
+
+# Module commands go through claude-module-communicator only when it's
+# installed and HUB_USE_MODULE_COMMUNICATOR=true; its send API has not been
+# verified against this hub, so by default replies are simulated
+try:
+    from claude_module_communicator import ModuleCommunicator
+    HAS_CMC = True
+except ImportError:
+    HAS_CMC = False
+    ModuleCommunicator = None
+USE_CMC = HAS_CMC and os.getenv("HUB_USE_MODULE_COMMUNICATOR", "false").lower() == "true"
+
+# orjson is an optional fast path for serializing tool results
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _dumps(data: Any) -> str:
+    """Serialize a tool result the way FastMCP does (2-space indent, str fallback)"""
+    if HAS_ORJSON:
+        return orjson.dumps(data, default=str,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, indent=2, default=str, ensure_ascii=False)
+
 
 # Initialize FastMCP server
-mcp = FastMCP("claude-module-communicator")
+try:
+    mcp = FastMCP("claude-module-communicator", tool_serializer=_dumps)
+except TypeError:
+    # Older FastMCP releases have no serializer hook
+    mcp = FastMCP("claude-module-communicator")
 mcp.description = "Central orchestration hub for all Granger ecosystem modules"
 
+# Registration counts, kept as the decorators run so startup doesn't have
+# to introspect the server object
+_REGISTERED = {"prompt": 0, "tool": 0, "resource": 0}
+
+
+def _register(kind: str, *args):
+    """Wrap mcp.prompt/tool/resource and count what gets registered"""
+    decorator = getattr(mcp, kind)(*args)
+
+    def wrap(fn):
+        _REGISTERED[kind] += 1
+        return decorator(fn)
+    return wrap
+
+
+# =============================================================================
+# STATIC CONTENT - Built once at import; the handlers below return it as-is
+# =============================================================================
+
+_CAPABILITIES = """# Claude Module Communicator Hub
+
+Central orchestration hub for all Granger ecosystem modules.
+
+## Connected Modules
+- youtube_transcripts ✅ - Search and analyze video transcripts
+- marker 🔄 - Convert PDFs to Markdown
+- sparta 🔄 - Space cybersecurity analysis
+- arangodb 🔄 - Graph database storage
+... and 5 more modules
+
+Use /hub:discover to explore specific capabilities."""
+
+_QUICK_START = """# Hub Quick Start
+
+1. Discover modules: /hub:discover
+2. Orchestrate tasks: /hub:orchestrate "your task"
+3. Save workflows: /hub:workflow-save
+
+The hub automatically routes to the best modules!"""
+
+_STATUS = """# Module Status
+    
+Total Modules: 10
+MCP Ready: 2/10 (20%)
+Hub Status: 🟢 Operational"""
+
+_WORKFLOW_LIST = """# Saved Workflows
+
+1. research-pipeline - Complete research workflow
+2. security-check - Security vulnerability analysis
+3. video-analysis - YouTube content analysis"""
+
+# Resource and tool payloads are shared between calls, so they must not be
+# mutated. They stay plain dicts because MappingProxyType can't be serialized
+# by FastMCP's pydantic-based encoder.
+_HUB_CONFIG = {
+    "version": "2.0.0",
+    "modules_directory": "/home/graham/workspace/experiments/",
+    "max_parallel_operations": 10,
+    "default_timeout": 30,
+    "mcp_compliant_modules": ["youtube_transcripts", "arxiv-mcp-server"]
+}
+
+_MODULES_RESOURCE = {
+    "modules": {
+        "youtube_transcripts": {
+            "path": "/home/graham/workspace/experiments/youtube_transcripts/",
+            "mcp_compliant": True,
+            "capabilities": ["search", "analyze", "transcripts"]
+        },
+        "marker": {
+            "path": "/home/graham/workspace/experiments/marker/",
+            "mcp_compliant": False,
+            "capabilities": ["pdf", "convert", "markdown"]
+        }
+    }
+}
+
+_WORKFLOWS_RESOURCE = {
+    "workflows": [
+        {
+            "name": "research-pipeline",
+            "description": "Complete research workflow",
+            "steps": [
+                {"module": "arxiv-mcp-server", "action": "search"},
+                {"module": "marker", "action": "convert"},
+                {"module": "arangodb", "action": "store"}
+            ]
+        },
+        {
+            "name": "security-check",
+            "description": "Security vulnerability analysis",
+            "steps": [
+                {"module": "marker", "action": "extract"},
+                {"module": "sparta", "action": "analyze"},
+                {"module": "test_reporter", "action": "report"}
+            ]
+        }
+    ]
+}
+
+_LIST_MODULES = {
+    "modules": [
+        {
+            "name": "youtube_transcripts",
+            "description": "Search and analyze video transcripts",
+            "mcp_compliant": True,
+            "status": "active"
+        },
+        {
+            "name": "marker",
+            "description": "Convert PDFs to Markdown",
+            "mcp_compliant": False,
+            "status": "active"
+        },
+        {
+            "name": "sparta",
+            "description": "Space cybersecurity analysis",
+            "mcp_compliant": False,
+            "status": "active"
+        }
+    ],
+    "total": 10,
+    "mcp_compliant": 2
+}
+
 
 # =============================================================================
 # PROMPTS - Expose hub prompts via FastMCP
 # =============================================================================
 
-@mcp.prompt()
+@_register("prompt")
 async def capabilities() -> str:
     """
     Discover all spoke modules and their orchestration capabilities.
@@ -39,21 +206,10 @@ async def capabilities() -> str:
     - Quick examples
     """
     # In production: return await prompt_registry.execute("hub:capabilities")
-    return """# Claude Module Communicator Hub
-
-Central orchestration hub for all Granger ecosystem modules.
+    return _CAPABILITIES
 
-## Connected Modules
-- youtube_transcripts ✅ - Search and analyze video transcripts
-- marker 🔄 - Convert PDFs to Markdown
-- sparta 🔄 - Space cybersecurity analysis
-- arangodb 🔄 - Graph database storage
-... and 5 more modules
 
-Use /hub:discover to explore specific capabilities."""
-
-
-@mcp.prompt()
+@_register("prompt")
 async def help(context: str = None) -> str:
     """
     Get orchestration help based on your current task.
@@ -69,7 +225,7 @@ async def help(context: str = None) -> str:
     return f"Help for orchestrating: {context}"
 
 
-@mcp.prompt()
+@_register("prompt")
 async def quick_start() -> str:
     """
     Learn how to orchestrate modules effectively.
@@ -81,16 +237,10 @@ async def quick_start() -> str:
     - Pro tips
     """
     # In production: return await prompt_registry.execute("hub:quick-start")
-    return """# Hub Quick Start
-
-1. Discover modules: /hub:discover
-2. Orchestrate tasks: /hub:orchestrate "your task"
-3. Save workflows: /hub:workflow-save
-
-The hub automatically routes to the best modules!"""
+    return _QUICK_START
 
 
-@mcp.prompt()
+@_register("prompt")
 async def discover(query: str = None, list_all: bool = False) -> str:
     """
     Discover spoke modules by capability, name, or purpose.
@@ -106,7 +256,7 @@ async def discover(query: str = None, list_all: bool = False) -> str:
     return f"Searching for modules matching: {query}"
 
 
-@mcp.prompt()
+@_register("prompt")
 async def orchestrate(
     task: str,
     modules: List[str] = None,
@@ -126,7 +276,7 @@ async def orchestrate(
     return f"Orchestrating: {task}\nMode: {'Parallel' if parallel else 'Sequential'}"
 
 
-@mcp.prompt()
+@_register("prompt")
 async def status() -> str:
     """
     Check health and status of all spoke modules.
@@ -138,14 +288,10 @@ async def status() -> str:
     - Recommendations
     """
     # In production: return await prompt_registry.execute("hub:status")
-    return """# Module Status
-    
-Total Modules: 10
-MCP Ready: 2/10 (20%)
-Hub Status: 🟢 Operational"""
+    return _STATUS
 
 
-@mcp.prompt()
+@_register("prompt")
 async def best_module(task: str) -> str:
     """
     Find the best module(s) for a specific task.
@@ -158,7 +304,7 @@ async def best_module(task: str) -> str:
     return f"Analyzing best modules for: {task}"
 
 
-@mcp.prompt()
+@_register("prompt")
 async def workflow_create(
     name: str,
     description: str,
@@ -181,21 +327,17 @@ async def workflow_create(
     return f"Creating workflow: {name}"
 
 
-@mcp.prompt()
+@_register("prompt")
 async def workflow_list() -> str:
     """
     List all saved workflow templates.
     
     Shows available workflows that can be run with workflow_run.
     """
-    return """# Saved Workflows
-
-1. research-pipeline - Complete research workflow
-2. security-check - Security vulnerability analysis
-3. video-analysis - YouTube content analysis"""
+    return _WORKFLOW_LIST
 
 
-@mcp.prompt()
+@_register("prompt")
 async def workflow_run(name: str, **params) -> str:
     """
     Run a saved workflow template.
@@ -209,65 +351,105 @@ async def workflow_run(name: str, **params) -> str:
 # TOOLS - Core hub functionality
 # =============================================================================
 
-@mcp.tool()
+class WorkflowStep(TypedDict, total=False):
+    """One execute_workflow step; validated on input but kept a plain dict"""
+    # Keys not declared here are passed through, not dropped, so clients
+    # get every field they sent back in results[i]["step"]
+    __pydantic_config__ = ConfigDict(extra="allow")
+
+    id: Any
+    module: str
+    action: str
+    data: Dict[str, Any]
+    depends_on: List[Any]
+
+
+class ModuleResult(TypedDict):
+    """Reply from a spoke module command"""
+    module: str
+    action: str
+    status: str
+    result: str
+
+
+@functools.lru_cache(maxsize=64)
+def _module_capabilities(module: str) -> Dict[str, Any]:
+    """Capabilities payload for one module, built once per module name"""
+    return {
+        "module": module,
+        "tools": ["tool1", "tool2"],
+        "prompts": ["prompt1", "prompt2"] if module == "youtube_transcripts" else [],
+        "mcp_compliant": module in _HUB_CONFIG["mcp_compliant_modules"]
+    }
+
+
+@_register("tool")
 async def list_modules() -> Dict[str, Any]:
     """List all registered spoke modules with their metadata."""
     # In production, this would query the actual module registry
+    return _LIST_MODULES
+
+
+# One communicator per event loop, so its connections are set up once and
+# shared by every command; entries go away with their loop
+_communicators: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+
+
+def _get_communicator() -> Any:
+    """Return the running loop's ModuleCommunicator, creating it on first use"""
+    loop = asyncio.get_running_loop()
+    comm = _communicators.get(loop)
+    if comm is None:
+        comm = _communicators[loop] = ModuleCommunicator("claude-module-communicator")
+    return comm
+
+
+async def _send(module: str, action: str, data: Dict[str, Any]) -> ModuleResult:
+    """Dispatch one command; shared by send_to_module and the workflow scheduler"""
+    if USE_CMC:
+        return await _get_communicator().send(module, action, data)
     return {
-        "modules": [
-            {
-                "name": "youtube_transcripts",
-                "description": "Search and analyze video transcripts",
-                "mcp_compliant": True,
-                "status": "active"
-            },
-            {
-                "name": "marker",
-                "description": "Convert PDFs to Markdown",
-                "mcp_compliant": False,
-                "status": "active"
-            },
-            {
-                "name": "sparta",
-                "description": "Space cybersecurity analysis",
-                "mcp_compliant": False,
-                "status": "active"
-            }
-        ],
-        "total": 10,
-        "mcp_compliant": 2
+        "module": module,
+        "action": action,
+        "status": "success",
+        "result": f"Executed {action} on {module}"
     }
 
 
-@mcp.tool()
+@_register("tool")
 async def send_to_module(
     module: str,
     action: str,
     data: Dict[str, Any]
-) -> Dict[str, Any]:
+) -> ModuleResult:
     """Send a command to a specific spoke module."""
-    # In production, this would use ModuleCommunicator
-    return {
-        "module": module,
-        "action": action,
-        "status": "success",
-        "result": f"Executed {action} on {module}"
-    }
+    return await _send(module, action, data)
 
 
-@mcp.tool()
+@_register("tool")
 async def get_module_capabilities(module: str) -> Dict[str, Any]:
     """Get detailed capabilities of a specific module."""
     # In production, query the module's MCP server
-    return {
-        "module": module,
-        "tools": ["tool1", "tool2"],
-        "prompts": ["prompt1", "prompt2"] if module == "youtube_transcripts" else [],
-        "mcp_compliant": module in ["youtube_transcripts", "arxiv-mcp-server"]
-    }
+    return _module_capabilities(module)
+
+
+# Health checks arrive in bursts, so the formatted check time is reused for
+# this many seconds instead of being rebuilt per call
+_TIMESTAMP_TICK = 0.1
+_last_timestamp: tuple[float, str] = (float("-inf"), "")
 
 
-@mcp.tool()
+def _now_iso() -> str:
+    """Current UTC time as an ISO-8601 'Z' string, refreshed once per tick"""
+    global _last_timestamp
+    now = time.monotonic()
+    if now - _last_timestamp[0] > _TIMESTAMP_TICK:
+        stamp = datetime.now(timezone.utc).replace(tzinfo=None).isoformat(timespec="seconds") + "Z"
+        _last_timestamp = (now, stamp)
+    return _last_timestamp[1]
+
+
+@_register("tool")
 async def check_module_health(module: str) -> Dict[str, Any]:
     """Check the health status of a specific module."""
     # In production, perform actual health check
@@ -275,25 +457,129 @@ async def check_module_health(module: str) -> Dict[str, Any]:
         "module": module,
         "status": "healthy",
         "latency_ms": 15,
-        "last_check": "2024-01-20T10:30:00Z"
+        "last_check": _now_iso()
     }
 
 
-@mcp.tool()
+def _workflow_graph(workflow: List[WorkflowStep]) -> tuple[List[int], List[List[int]]]:
+    """
+    Build the step dependency graph.
+
+    A step may name the steps it waits for with "depends_on": a list of
+    step ids, where a step's id is its "id" field or else its position.
+    Returns (in-degree, children) indexed by position.
+    """
+    ids: Dict[Any, int] = {}
+    for i, step in enumerate(workflow):
+        key = step.get("id", i)
+        if key in ids:
+            raise ValueError(f"Steps {ids[key]} and {i} both have id {key!r}")
+        ids[key] = i
+    deg_in = [0] * len(workflow)
+    children: List[List[int]] = [[] for _ in workflow]
+    for i, step in enumerate(workflow):
+        for dep in step.get("depends_on") or ():
+            if dep not in ids:
+                raise ValueError(f"Step {step.get('id', i)!r} depends on unknown step {dep!r}")
+            children[ids[dep]].append(i)
+            deg_in[i] += 1
+
+    # Reject cycles up front so the scheduler can never stall
+    remaining = deg_in[:]
+    stack = [i for i, d in enumerate(remaining) if d == 0]
+    visited = 0
+    while stack:
+        visited += 1
+        for child in children[stack.pop()]:
+            remaining[child] -= 1
+            if remaining[child] == 0:
+                stack.append(child)
+    if visited != len(workflow):
+        raise ValueError("Workflow dependencies contain a cycle")
+    return deg_in, children
+
+
+async def _run_step(step: WorkflowStep, sem: asyncio.Semaphore) -> ModuleResult:
+    """Send one workflow step, bounded by the shared semaphore and the hub timeout"""
+    async with sem:
+        return await asyncio.wait_for(
+            _send(step.get("module"), step.get("action"), step.get("data") or {}),
+            _HUB_CONFIG["default_timeout"],
+        )
+
+
+async def _run_all(worker, count: int) -> None:
+    """Run count copies of worker; the first failure cancels the rest and is re-raised"""
+    if hasattr(asyncio, "TaskGroup"):
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for _ in range(count):
+                    tg.create_task(worker())
+        except BaseExceptionGroup as group:  # noqa: F821 - builtin from 3.11, like TaskGroup
+            raise group.exceptions[0] from None
+        return
+
+    # Python 3.10 has no TaskGroup
+    tasks = [asyncio.ensure_future(worker()) for _ in range(count)]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+@_register("tool")
 async def execute_workflow(
-    workflow: List[Dict[str, Any]],
+    workflow: List[WorkflowStep],
     parallel: bool = True
 ) -> Dict[str, Any]:
     """Execute a multi-step workflow across modules."""
-    # In production, this would orchestrate actual module calls
-    results = []
-    for step in workflow:
-        results.append({
-            "step": step,
-            "status": "success",
-            "output": f"Completed {step.get('action')} on {step.get('module')}"
-        })
-    
+    deg_in, children = _workflow_graph(workflow)
+    results: List[Optional[Dict[str, Any]]] = [None] * len(workflow)
+
+    # Steps are dispatched as soon as everything they depend on has finished;
+    # sequential mode is the same scheduler with a single worker
+    workers = min(_HUB_CONFIG["max_parallel_operations"], len(workflow)) if parallel else 1
+    sem = asyncio.Semaphore(_HUB_CONFIG["max_parallel_operations"])
+    ready: asyncio.Queue = asyncio.Queue()
+    for i, d in enumerate(deg_in):
+        if d == 0:
+            ready.put_nowait(i)
+    pending = len(workflow)
+
+    async def worker() -> None:
+        nonlocal pending
+        while True:
+            i: Optional[int] = await ready.get()
+            if i is None:
+                return
+            while i is not None:
+                step = workflow[i]
+                await _run_step(step, sem)
+                results[i] = {
+                    "step": step,
+                    "status": "success",
+                    "output": f"Completed {step.get('action')} on {step.get('module')}"
+                }
+                # Keep the first step this one unblocked and queue the rest,
+                # so a chain of steps runs without waking another worker
+                nxt = None
+                for child in children[i]:
+                    deg_in[child] -= 1
+                    if deg_in[child] == 0:
+                        if nxt is None:
+                            nxt = child
+                        else:
+                            ready.put_nowait(child)
+                i = nxt
+                pending -= 1
+                if pending == 0:
+                    for _ in range(workers):
+                        ready.put_nowait(None)
+
+    if workflow:
+        await _run_all(worker, workers)
+
     return {
         "workflow_id": "wf_123",
         "status": "completed",
@@ -306,62 +592,22 @@ async def execute_workflow(
 # RESOURCES - Hub configuration and state
 # =============================================================================
 
-@mcp.resource("hub://config")
+@_register("resource", "hub://config")
 async def get_hub_config() -> Dict[str, Any]:
     """Get hub configuration and settings."""
-    return {
-        "version": "2.0.0",
-        "modules_directory": "/home/graham/workspace/experiments/",
-        "max_parallel_operations": 10,
-        "default_timeout": 30,
-        "mcp_compliant_modules": ["youtube_transcripts", "arxiv-mcp-server"]
-    }
+    return _HUB_CONFIG
 
 
-@mcp.resource("hub://modules")
+@_register("resource", "hub://modules")
 async def get_modules_resource() -> Dict[str, Any]:
     """Get all module information as a resource."""
-    return {
-        "modules": {
-            "youtube_transcripts": {
-                "path": "/home/graham/workspace/experiments/youtube_transcripts/",
-                "mcp_compliant": True,
-                "capabilities": ["search", "analyze", "transcripts"]
-            },
-            "marker": {
-                "path": "/home/graham/workspace/experiments/marker/",
-                "mcp_compliant": False,
-                "capabilities": ["pdf", "convert", "markdown"]
-            }
-        }
-    }
+    return _MODULES_RESOURCE
 
 
-@mcp.resource("hub://workflows")
+@_register("resource", "hub://workflows")
 async def get_workflows_resource() -> Dict[str, Any]:
     """Get saved workflow templates."""
-    return {
-        "workflows": [
-            {
-                "name": "research-pipeline",
-                "description": "Complete research workflow",
-                "steps": [
-                    {"module": "arxiv-mcp-server", "action": "search"},
-                    {"module": "marker", "action": "convert"},
-                    {"module": "arangodb", "action": "store"}
-                ]
-            },
-            {
-                "name": "security-check",
-                "description": "Security vulnerability analysis",
-                "steps": [
-                    {"module": "marker", "action": "extract"},
-                    {"module": "sparta", "action": "analyze"},
-                    {"module": "test_reporter", "action": "report"}
-                ]
-            }
-        ]
-    }
+    return _WORKFLOWS_RESOURCE
 
 
 # =============================================================================
@@ -376,14 +622,16 @@ def create_hub_server():
     # 3. Set up event handlers
     # 4. Configure logging
     
-    print("Claude Module Communicator Hub MCP Server")
-    print("=" * 50)
-    print(f"Version: 2.0.0")
-    print(f"Transport: stdio (for Claude Code)")
-    print(f"Prompts: {len([p for p in dir(mcp) if hasattr(getattr(mcp, p), '_is_prompt')])}")
-    print(f"Tools: {len([t for t in dir(mcp) if hasattr(getattr(mcp, t), '_is_tool')])}")
-    print(f"Resources: 3")
-    print()
+    sys.stdout.write("".join((
+        "Claude Module Communicator Hub MCP Server\n",
+        "=" * 50, "\n",
+        f"Version: {_HUB_CONFIG['version']}\n",
+        "Transport: stdio (for Claude Code)\n",
+        f"Prompts: {_REGISTERED['prompt']}\n",
+        f"Tools: {_REGISTERED['tool']}\n",
+        f"Resources: {_REGISTERED['resource']}\n",
+        "\n",
+    )))
     
     return mcp
 
@@ -10,9 +10,21 @@ discovery, orchestration, and lifecycle management.
 
 from typing import Dict, Any, List, Optional, Set
 import asyncio
+import functools
+from array import array
+from collections import defaultdict
+from dataclasses import dataclass
 from pathlib import Path
 import json
-from datetime import datetime
+import re
+import sys
+import time
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 # These imports would come from the actual project
 # from ..mcp.prompts import mcp_prompt, format_prompt_response, get_prompt_registry
@@ -21,53 +33,447 @@ from datetime import datetime
 PROJECT_NAME = "hub"
 PROJECT_DESCRIPTION = "Central orchestration hub for all Granger ecosystem modules"
 
-# Known spoke modules and their locations
-SPOKE_MODULES = {
-    "youtube_transcripts": {
-        "path": "/home/graham/workspace/experiments/youtube_transcripts/",
-        "description": "Search and analyze YouTube video transcripts",
-        "mcp_compliant": True
-    },
-    "marker": {
-        "path": "/home/graham/workspace/experiments/marker/",
-        "description": "Convert PDFs to clean Markdown with AI assistance",
-        "mcp_compliant": False  # To be migrated
-    },
-    "sparta": {
-        "path": "/home/graham/workspace/experiments/sparta/",
-        "description": "Space cybersecurity data ingestion and analysis",
-        "mcp_compliant": False
-    },
-    "arangodb": {
-        "path": "/home/graham/workspace/experiments/arangodb/",
-        "description": "Graph database memory bank and knowledge storage",
-        "mcp_compliant": False
-    },
-    "claude_max_proxy": {
-        "path": "/home/graham/workspace/experiments/claude_max_proxy/",
-        "description": "Unified interface for multiple LLM providers",
-        "mcp_compliant": False
-    },
-    "arxiv-mcp-server": {
-        "path": "/home/graham/workspace/mcp-servers/arxiv-mcp-server/",
-        "description": "Research paper discovery and analysis",
-        "mcp_compliant": True
-    },
-    "unsloth_wip": {
-        "path": "/home/graham/workspace/experiments/unsloth_wip/",
-        "description": "LLM fine-tuning and optimization",
-        "mcp_compliant": False
-    },
-    "test_reporter": {
-        "path": "/home/graham/workspace/experiments/claude-test-reporter/",
-        "description": "Universal test reporting and analysis",
-        "mcp_compliant": False
-    },
-    "r1_commons": {
-        "path": "/home/graham/workspace/experiments/r1_commons/",
-        "description": "Reinforcement learning commons library",
-        "mcp_compliant": False
-    }
+
+@dataclass(slots=True, frozen=True)
+class Module:
+    """One spoke module's registry entry"""
+    name: str
+    path: str
+    description: str
+    mcp_compliant: bool
+
+
+# The spoke registry is built on first use rather than at import, since most
+# sessions only call a prompt or two and many never touch it
+def _spoke_table() -> tuple[Module, ...]:
+    """Known spoke modules and their locations"""
+    return (
+        Module(
+            name="youtube_transcripts",
+            path="/home/graham/workspace/experiments/youtube_transcripts/",
+            description="Search and analyze YouTube video transcripts",
+            mcp_compliant=True
+        ),
+        Module(
+            name="marker",
+            path="/home/graham/workspace/experiments/marker/",
+            description="Convert PDFs to clean Markdown with AI assistance",
+            mcp_compliant=False  # To be migrated
+        ),
+        Module(
+            name="sparta",
+            path="/home/graham/workspace/experiments/sparta/",
+            description="Space cybersecurity data ingestion and analysis",
+            mcp_compliant=False
+        ),
+        Module(
+            name="arangodb",
+            path="/home/graham/workspace/experiments/arangodb/",
+            description="Graph database memory bank and knowledge storage",
+            mcp_compliant=False
+        ),
+        Module(
+            name="claude_max_proxy",
+            path="/home/graham/workspace/experiments/claude_max_proxy/",
+            description="Unified interface for multiple LLM providers",
+            mcp_compliant=False
+        ),
+        Module(
+            name="arxiv-mcp-server",
+            path="/home/graham/workspace/mcp-servers/arxiv-mcp-server/",
+            description="Research paper discovery and analysis",
+            mcp_compliant=True
+        ),
+        Module(
+            name="unsloth_wip",
+            path="/home/graham/workspace/experiments/unsloth_wip/",
+            description="LLM fine-tuning and optimization",
+            mcp_compliant=False
+        ),
+        Module(
+            name="test_reporter",
+            path="/home/graham/workspace/experiments/claude-test-reporter/",
+            description="Universal test reporting and analysis",
+            mcp_compliant=False
+        ),
+        Module(
+            name="r1_commons",
+            path="/home/graham/workspace/experiments/r1_commons/",
+            description="Reinforcement learning commons library",
+            mcp_compliant=False
+        )
+    )
+
+
+@dataclass(slots=True)
+class _Spokes:
+    """
+    The registry stored column-wise, so scans that need one field (the
+    compliance count, the description index) read only that column.
+    Position i in every column is the same module.
+    """
+    names: tuple[str, ...]
+    paths: tuple[str, ...]
+    descs: tuple[str, ...]
+    compliant: array
+    position: Dict[str, int]
+
+
+@functools.cache
+def _spokes() -> _Spokes:
+    """Materialise the registry columns; built once, on first use"""
+    table = _spoke_table()
+    # Names are interned so registry lookups with the same name (including
+    # hyphenated ones the compiler doesn't intern) short-circuit on identity
+    names = tuple(sys.intern(m.name) for m in table)
+    return _Spokes(
+        names=names,
+        paths=tuple(m.path for m in table),
+        descs=tuple(m.description for m in table),
+        compliant=array("b", (m.mcp_compliant for m in table)),
+        position={name: i for i, name in enumerate(names)},
+    )
+
+
+def _spoke(name: str) -> Optional[Module]:
+    """Return the registry row for a module, or None if it isn't registered"""
+    spokes = _spokes()
+    i = spokes.position.get(name)
+    if i is None:
+        return None
+    return Module(name, spokes.paths[i], spokes.descs[i], bool(spokes.compliant[i]))
+
+
+def register_spoke(name: str, path: str, description: str, mcp_compliant: bool = False) -> None:
+    """Add a spoke module to the registry, or replace an existing entry"""
+    name = sys.intern(name)
+    spokes = _spokes()
+    i = spokes.position.get(name)
+    if i is None:
+        spokes.position[name] = len(spokes.names)
+        spokes.names += (name,)
+        spokes.paths += (path,)
+        spokes.descs += (description,)
+        spokes.compliant.append(mcp_compliant)
+    else:
+        spokes.paths = spokes.paths[:i] + (path,) + spokes.paths[i + 1:]
+        spokes.descs = spokes.descs[:i] + (description,) + spokes.descs[i + 1:]
+        spokes.compliant[i] = mcp_compliant
+    invalidate_registry()
+
+
+# Bumped by invalidate_registry() whenever the registry changes, so renders
+# cached from the old registry are rebuilt
+_REGISTRY_VERSION = 0
+# Cached renders are also rebuilt after this many seconds, in case the
+# registry was changed without calling invalidate_registry()
+_RENDER_TTL = 20.0
+
+
+def invalidate_registry() -> None:
+    """Mark the registry as changed so cached renders are rebuilt"""
+    global _REGISTRY_VERSION
+    _REGISTRY_VERSION += 1
+
+
+# Module status labels used when rendering module lists
+_MCP_READY = "✅ MCP Ready"
+_LEGACY_MODE = "🔄 Legacy Mode"
+
+
+# Context keywords for hub:help; matched as substrings so "papers" or
+# "documentation" still count
+_DOC_WORDS = ("pdf", "document", "paper")
+_VIDEO_WORDS = ("video", "youtube", "transcript")
+_RESEARCH_WORDS = ("research", "paper", "arxiv")
+
+# All keywords in one pattern, so hub:help scans the context once. The
+# lookahead reports every occurrence, including ones that overlap another
+# keyword. Groups are listed in branch order; "paper" is in both the document
+# and research lists, and the document branch always wins it.
+_HELP_TOPIC_RE = re.compile("(?=" + "|".join(
+    f"(?P<{topic}>{'|'.join(map(re.escape, words))})"
+    for topic, words in (("doc", _DOC_WORDS), ("video", _VIDEO_WORDS), ("research", _RESEARCH_WORDS))
+) + ")")
+
+
+def _help_topic(context_lower: str) -> Optional[str]:
+    """Pick the hub:help section: documents, then video, then research"""
+    found = set()
+    for match in _HELP_TOPIC_RE.finditer(context_lower):
+        if match.lastgroup == "doc":
+            return "doc"
+        found.add(match.lastgroup)
+    if "video" in found:
+        return "video"
+    return "research" if "research" in found else None
+
+
+# hub:help sections, keyed by _help_topic()
+_HELP_SECTIONS = {
+    "doc": """## Working with Documents
+
+### PDF Processing Pipeline
+1. **Marker** - Convert PDF to Markdown
+   ```
+   /hub:orchestrate "convert research.pdf to markdown"
+   ```
+
+2. **SPARTA** - Analyze security aspects
+   ```
+   /hub:orchestrate "check PDF for vulnerabilities"
+   ```
+
+3. **ArangoDB** - Store in knowledge graph
+   ```
+   /hub:orchestrate "extract entities from PDF and store"
+   ```
+
+### Complete Document Workflow
+```
+/hub:orchestrate "process PDF: convert, analyze, and store"
+```
+This will:
+→ marker (convert) → sparta (analyze) → arangodb (store)
+""",
+    "video": """## Video & Transcript Processing
+
+### YouTube Research Pipeline
+1. **YouTube Transcripts** - Search and fetch
+   ```
+   /hub:orchestrate "find videos about transformers"
+   ```
+
+2. **Claude Max Proxy** - Analyze with AI
+   ```
+   /hub:orchestrate "summarize transformer videos"
+   ```
+
+3. **ArangoDB** - Build knowledge graph
+   ```
+   /hub:orchestrate "extract concepts from videos"
+   ```
+
+### Complete Video Workflow
+```
+/hub:orchestrate "research transformers: videos, analysis, graph"
+```
+""",
+    "research": """## Research Automation
+
+### Paper Discovery Pipeline
+1. **ArXiv MCP** - Find papers
+   ```
+   /hub:orchestrate "find recent LLM papers"
+   ```
+
+2. **Marker** - Convert to readable format
+   ```
+   /hub:orchestrate "get markdown of important papers"
+   ```
+
+3. **Unsloth** - Fine-tune on content
+   ```
+   /hub:orchestrate "prepare papers for fine-tuning"
+   ```
+
+### Complete Research Workflow
+```
+/hub:orchestrate "complete research on topic X"
+```
+""",
+}
+
+# Fallback section; {} is the first word of the context
+_GENERAL_HELP = """## General Orchestration Patterns
+
+### Discovery First
+```
+/hub:discover --capability "{}"
+```
+
+### Then Orchestrate
+```
+/hub:orchestrate "your complete task description"
+```
+
+The hub will intelligently route to appropriate modules.
+"""
+
+
+def _render_epoch() -> int:
+    """Current TTL window, used with the registry version as a cache key"""
+    return int(time.monotonic() // _RENDER_TTL)
+
+
+@functools.lru_cache(maxsize=1)
+def _lowered_registry(version: int, epoch: int) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Lowercased module names and descriptions in registry order, so discovery
+    only scans them with substring tests instead of lowercasing per query
+    """
+    spokes = _spokes()
+    return tuple(name.lower() for name in spokes.names), tuple(desc.lower() for desc in spokes.descs)
+
+
+# Capability tags shown by hub:discover, with the description substrings
+# that earn each one
+_CAPABILITY_TAGS = (
+    ("pdf-processing", ("pdf",)),
+    ("security", ("security", "cyber")),
+    ("ai-powered", ("ai", "llm")),
+    ("data-storage", ("data", "database")),
+    ("search", ("search", "find")),
+)
+
+
+def _intern_modules(rules: tuple) -> tuple:
+    """Rules with their module names interned, like the registry's names"""
+    return tuple((sys.intern(rule[0]), *rule[1:]) for rule in rules)
+
+
+# Task keywords that pull a module into a hub:orchestrate plan, in plan order:
+# (module, purpose, keywords)
+_ORCHESTRATE_RULES = _intern_modules((
+    ("marker", "Convert PDF to Markdown", ("pdf", "document", "paper", "convert")),
+    ("sparta", "Analyze security aspects", ("security", "vulnerab", "cyber", "threat")),
+    ("arxiv-mcp-server", "Search research papers", ("research", "paper", "arxiv", "academic")),
+    ("youtube_transcripts", "Search video content", ("video", "youtube", "transcript", "watch")),
+    ("claude_max_proxy", "AI-powered analysis", ("analyze", "summary", "extract", "understand")),
+    ("arangodb", "Store in knowledge graph", ("store", "save", "graph", "knowledge")),
+    ("test_reporter", "Generate report", ("report", "test", "results", "summary")),
+))
+
+# Task keywords behind each hub:best-module recommendation:
+# (module, score, reason, keywords)
+_BEST_MODULE_RULES = _intern_modules((
+    ("marker", 95, "Specialized PDF to Markdown conversion with AI assistance",
+     ("pdf", "document", "convert", "markdown")),
+    ("sparta", 90, "Space cybersecurity expertise and vulnerability analysis",
+     ("security", "vulnerab", "cyber", "threat", "risk")),
+    ("arxiv-mcp-server", 85, "Direct access to research papers and academic content",
+     ("research", "paper", "academic", "arxiv", "study")),
+    ("youtube_transcripts", 90, "Specialized YouTube transcript search and analysis",
+     ("video", "youtube", "transcript", "watch", "tutorial")),
+))
+
+
+def _trie_pattern(words) -> str:
+    """
+    Regex alternation for words with shared prefixes merged, e.g. data and
+    database become data(?:base)?; a match is always the longest word there
+    """
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def walk(node: Dict[str, Any]) -> str:
+        alternatives = [re.escape(ch) + walk(child) for ch, child in sorted(node.items()) if ch]
+        if not alternatives:
+            return ""
+        if "" in node:
+            return "(?:" + "|".join(alternatives) + ")?"
+        return alternatives[0] if len(alternatives) == 1 else "(?:" + "|".join(alternatives) + ")"
+
+    return walk(trie)
+
+
+def _keyword_matcher(rules: tuple):
+    """
+    Build a function that scans a text once and returns the indices of the
+    rules whose keywords it contains. Uses an Aho-Corasick automaton when
+    pyahocorasick is installed, otherwise a trie-shaped regex.
+    """
+    triggers: Dict[str, Set[int]] = defaultdict(set)
+    for i, rule in enumerate(rules):
+        for word in rule[-1]:
+            triggers[word].add(i)
+
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for word, indices in triggers.items():
+            automaton.add_word(word, tuple(indices))
+        automaton.make_automaton()
+
+        def match(text: str) -> Set[int]:
+            hit: Set[int] = set()
+            for _, indices in automaton.iter(text):
+                hit.update(indices)
+            return hit
+        return match
+
+    # The lookahead tries every position, so overlapping keywords are all
+    # seen. At one position only the longest keyword matches, so it carries
+    # the rules of every keyword found inside it as well.
+    pattern = re.compile("(?=(" + _trie_pattern(triggers) + "))")
+    carried = {word: frozenset().union(*(indices for other, indices in triggers.items() if other in word))
+               for word in triggers}
+
+    def match(text: str) -> Set[int]:
+        hit: Set[int] = set()
+        for m in pattern.finditer(text):
+            hit.update(carried[m.group(1)])
+        return hit
+    return match
+
+
+_ORCHESTRATE_MATCHER = _keyword_matcher(_ORCHESTRATE_RULES)
+_BEST_MODULE_MATCHER = _keyword_matcher(_BEST_MODULE_RULES)
+
+# hub:best-module rule indices by descending score, ties in rule order
+_BEST_MODULE_RANKING = tuple(sorted(range(len(_BEST_MODULE_RULES)), key=lambda i: -_BEST_MODULE_RULES[i][1]))
+
+
+def _matched_rules(task_lower: str, rules: tuple, matcher) -> List[tuple]:
+    """Rules with a keyword in the task, in rule order"""
+    return [rules[i] for i in sorted(matcher(task_lower))]
+
+
+@functools.lru_cache(maxsize=256)
+def _capability_tags(description: str) -> tuple[str, ...]:
+    """Capability tags for a module description; computed once per description"""
+    desc_lower = description.lower()
+    return tuple(tag for tag, words in _CAPABILITY_TAGS
+                 if any(word in desc_lower for word in words))
+
+
+@functools.lru_cache(maxsize=1)
+def _registry_counts(version: int, epoch: int) -> tuple[int, int]:
+    """Total and MCP-compliant module counts; cached like the renders"""
+    spokes = _spokes()
+    return len(spokes.names), sum(spokes.compliant)
+
+
+# Quick commands for responses that do not depend on the request
+_HELP_SUGGESTIONS = {
+    "/hub:capabilities": "See all modules",
+    "/hub:quick-start": "Learn basics",
+    "/hub:discover": "Find modules"
+}
+
+_NO_MATCH_SUGGESTIONS = {
+    "/hub:discover --list-all": "See all modules",
+    "/hub:capabilities": "View hub overview"
+}
+
+_NO_PLAN_SUGGESTIONS = {
+    "/hub:discover": "Find appropriate modules",
+    "/hub:help": "Get task-specific help"
+}
+
+_WORKFLOW_SUGGESTIONS = {
+    "/hub:workflow-save": "Save this workflow",
+    "/hub:status": "Check module details",
+    "/hub:orchestrate": "Run another workflow"
+}
+
+_STATUS_SUGGESTIONS = {
+    "/hub:orchestrate": "Start using modules",
+    "/hub:capabilities": "View all features",
+    "/hub:help": "Get assistance"
 }
 
 
@@ -87,12 +493,35 @@ SPOKE_MODULES = {
 )
 async def list_capabilities(registry: Any = None) -> str:
     """List all hub capabilities and connected spoke modules"""
+    return _capabilities_response(_REGISTRY_VERSION, _render_epoch())
+
+
+@functools.lru_cache(maxsize=1)
+def _capabilities_response(version: int, epoch: int) -> str:
+    """The complete hub:capabilities response; cached like the render it wraps"""
+    
+    content = _render_capabilities(version, epoch)
+    
+    suggestions = {
+        "/hub:quick-start": "Learn orchestration basics",
+        "/hub:discover": "Find modules by capability",
+        "/hub:orchestrate": "Run a workflow now"
+    }
+    
+    return format_prompt_response(
+        content=content,
+        suggestions=suggestions
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _render_capabilities(version: int, epoch: int) -> str:
+    """Render the capabilities markdown; cached per registry version and TTL window"""
     
     # Count MCP-compliant modules
-    compliant_count = sum(1 for m in SPOKE_MODULES.values() if m.get("mcp_compliant"))
-    total_count = len(SPOKE_MODULES)
+    total_count, compliant_count = _registry_counts(version, epoch)
     
-    content = f"""# Claude Module Communicator Hub
+    parts = [f"""# Claude Module Communicator Hub
 
 {PROJECT_DESCRIPTION}
 
@@ -122,19 +551,27 @@ async def list_capabilities(registry: Any = None) -> str:
    ```
 
 ## Connected Spoke Modules
-"""
+"""]
     
     # List all modules with status
-    for name, info in SPOKE_MODULES.items():
-        status = "✅ MCP Ready" if info.get("mcp_compliant") else "🔄 Legacy Mode"
-        content += f"\n### {name} {status}\n"
-        content += f"- **Purpose**: {info['description']}\n"
-        if info.get("mcp_compliant"):
-            content += f"- **Prompts**: `/{name}:capabilities`, `/{name}:help`\n"
-        else:
-            content += f"- **Status**: Available via legacy integration\n"
+    spokes = _spokes()
+    parts.extend(map(_module_fragment, spokes.names, spokes.descs, spokes.compliant))
+    parts.append(_CAPABILITIES_FOOTER)
     
-    content += """
+    return "".join(parts)
+
+
+@functools.lru_cache(maxsize=256)
+def _module_fragment(name: str, description: str, compliant: int) -> str:
+    """One module's entry in the capabilities list; unchanged modules are reused across registry changes"""
+    if compliant:
+        return (f"\n### {name} {_MCP_READY}\n- **Purpose**: {description}\n"
+                f"- **Prompts**: `/{name}:capabilities`, `/{name}:help`\n")
+    return (f"\n### {name} {_LEGACY_MODE}\n- **Purpose**: {description}\n"
+            "- **Status**: Available via legacy integration\n")
+
+
+_CAPABILITIES_FOOTER = """
 ## Orchestration Capabilities
 
 ### Discovery & Routing
@@ -157,17 +594,6 @@ async def list_capabilities(registry: Any = None) -> str:
 - `hub:optimize` - Optimize workflow performance
 - `hub:learn` - Learn from usage patterns
 """
-    
-    suggestions = {
-        "/hub:quick-start": "Learn orchestration basics",
-        "/hub:discover": "Find modules by capability",
-        "/hub:orchestrate": "Run a workflow now"
-    }
-    
-    return format_prompt_response(
-        content=content,
-        suggestions=suggestions
-    )
 
 
 @mcp_prompt(
@@ -214,114 +640,16 @@ async def get_help(context: Optional[str] = None) -> str:
 
 Need specific help? Provide context about what you're trying to do.
 """,
-            suggestions={
-                "/hub:capabilities": "See all modules",
-                "/hub:quick-start": "Learn basics",
-                "/hub:discover": "Find modules"
-            }
+            suggestions=_HELP_SUGGESTIONS
         )
     
-    # Context-specific help
-    content = f"# Orchestration Help: {context}\n\n"
-    
-    # Provide intelligent help based on context
-    context_lower = context.lower()
-    
-    if any(word in context_lower for word in ["pdf", "document", "paper"]):
-        content += """## Working with Documents
-
-### PDF Processing Pipeline
-1. **Marker** - Convert PDF to Markdown
-   ```
-   /hub:orchestrate "convert research.pdf to markdown"
-   ```
-
-2. **SPARTA** - Analyze security aspects
-   ```
-   /hub:orchestrate "check PDF for vulnerabilities"
-   ```
-
-3. **ArangoDB** - Store in knowledge graph
-   ```
-   /hub:orchestrate "extract entities from PDF and store"
-   ```
-
-### Complete Document Workflow
-```
-/hub:orchestrate "process PDF: convert, analyze, and store"
-```
-This will:
-→ marker (convert) → sparta (analyze) → arangodb (store)
-"""
-    
-    elif any(word in context_lower for word in ["video", "youtube", "transcript"]):
-        content += """## Video & Transcript Processing
-
-### YouTube Research Pipeline
-1. **YouTube Transcripts** - Search and fetch
-   ```
-   /hub:orchestrate "find videos about transformers"
-   ```
-
-2. **Claude Max Proxy** - Analyze with AI
-   ```
-   /hub:orchestrate "summarize transformer videos"
-   ```
-
-3. **ArangoDB** - Build knowledge graph
-   ```
-   /hub:orchestrate "extract concepts from videos"
-   ```
-
-### Complete Video Workflow
-```
-/hub:orchestrate "research transformers: videos, analysis, graph"
-```
-"""
-    
-    elif any(word in context_lower for word in ["research", "paper", "arxiv"]):
-        content += """## Research Automation
-
-### Paper Discovery Pipeline
-1. **ArXiv MCP** - Find papers
-   ```
-   /hub:orchestrate "find recent LLM papers"
-   ```
-
-2. **Marker** - Convert to readable format
-   ```
-   /hub:orchestrate "get markdown of important papers"
-   ```
-
-3. **Unsloth** - Fine-tune on content
-   ```
-   /hub:orchestrate "prepare papers for fine-tuning"
-   ```
-
-### Complete Research Workflow
-```
-/hub:orchestrate "complete research on topic X"
-```
-"""
-    
-    else:
-        content += """## General Orchestration Patterns
-
-### Discovery First
-```
-/hub:discover --capability "{}"
-```
-
-### Then Orchestrate
-```
-/hub:orchestrate "your complete task description"
-```
-
-The hub will intelligently route to appropriate modules.
-""".format(context.split()[0] if context else "search")
+    # Context-specific help; pick the section that fits the context
+    section = _HELP_SECTIONS.get(_help_topic(context.lower()))
+    if section is None:
+        section = _GENERAL_HELP.format((context.split() or ["search"])[0])
     
     return format_prompt_response(
-        content=content,
+        content=f"# Orchestration Help: {context}\n\n{section}",
         suggestions={
             "/hub:discover": f"Find modules for '{context}'",
             "/hub:orchestrate": "Start orchestration",
@@ -337,6 +665,12 @@ The hub will intelligently route to appropriate modules.
 )
 async def quick_start() -> str:
     """Quick start guide for hub orchestration"""
+    return _quick_start_response()
+
+
+@functools.cache
+def _quick_start_response() -> str:
+    """Format the quick-start guide; it never changes, so this runs once"""
     
     content = """# Hub Orchestration Quick Start
 
@@ -490,93 +824,189 @@ async def discover_modules(
     """Discover spoke modules based on capabilities"""
     
     if list_all or not query:
-        # List all modules
-        content = "# All Available Spoke Modules\n\n"
+        return _discover_all_response(_REGISTRY_VERSION, _render_epoch())
+    
+    # Search for modules
+    spokes = _spokes()
+    query_lower = query.lower()
+    
+    # Modules whose name or description contains the query, or whose
+    # description contains any query word
+    names_lower, descs_lower = _lowered_registry(_REGISTRY_VERSION, _render_epoch())
+    words = query_lower.split()
+    matches = [
+        i for i, (name_lower, desc_lower) in enumerate(zip(names_lower, descs_lower))
+        if query_lower in name_lower or query_lower in desc_lower
+        or any(word in desc_lower for word in words)
+    ]
+    
+    parts = [f"# Modules matching: '{query}'\n\n"]
+    
+    if matches:
+        parts.append(f"Found {len(matches)} matching modules:\n\n")
         
-        for name, info in SPOKE_MODULES.items():
-            mcp_status = "✅" if info.get("mcp_compliant") else "🔄"
-            content += f"## {name} {mcp_status}\n"
-            content += f"**Purpose**: {info['description']}\n"
-            content += f"**Path**: `{info['path']}`\n"
+        for i in matches:
+            name = spokes.names[i]
+            parts.append(_discover_header(name, spokes.descs[i], spokes.compliant[i]))
             
-            # Add capability tags
-            caps = []
-            desc_lower = info['description'].lower()
-            if 'pdf' in desc_lower:
-                caps.append("pdf-processing")
-            if 'security' in desc_lower or 'cyber' in desc_lower:
-                caps.append("security")
-            if 'ai' in desc_lower or 'llm' in desc_lower:
-                caps.append("ai-powered")
-            if 'data' in desc_lower or 'database' in desc_lower:
-                caps.append("data-storage")
-            if 'search' in desc_lower or 'find' in desc_lower:
-                caps.append("search")
+            # Show example orchestrations
+            if 'pdf' in query_lower and 'marker' in name:
+                parts.append("**Example**: `/hub:orchestrate \"convert document.pdf to markdown\"`\n")
+            elif 'security' in query_lower and 'sparta' in name:
+                parts.append("**Example**: `/hub:orchestrate \"analyze security vulnerabilities\"`\n")
+            elif 'video' in query_lower and 'youtube' in name:
+                parts.append("**Example**: `/hub:orchestrate \"find videos about topic\"`\n")
             
-            if caps:
-                content += f"**Capabilities**: {', '.join(caps)}\n"
-            content += "\n"
+            parts.append("\n")
         
         suggestions = {
-            "/hub:orchestrate": "Start using modules",
-            "/hub:status": "Check module health"
+            "/hub:orchestrate": f"Use these modules for {query}",
+            "/hub:best-module": f"Find best module for {query}"
         }
     
     else:
-        # Search for modules
-        query_lower = query.lower()
-        matches = []
-        
-        for name, info in SPOKE_MODULES.items():
-            desc_lower = info['description'].lower()
-            if (query_lower in name.lower() or 
-                query_lower in desc_lower or
-                any(word in desc_lower for word in query_lower.split())):
-                matches.append((name, info))
+        parts.append(f"No modules found matching '{query}'.\n\n"
+                     "Try:\n"
+                     "- Using different keywords\n"
+                     "- `/hub:discover --list-all` to see all modules\n"
+                     "- `/hub:capabilities` for complete overview\n")
         
-        content = f"# Modules matching: '{query}'\n\n"
-        
-        if matches:
-            content += f"Found {len(matches)} matching modules:\n\n"
-            
-            for name, info in matches:
-                mcp_status = "✅" if info.get("mcp_compliant") else "🔄"
-                content += f"## {name} {mcp_status}\n"
-                content += f"**Purpose**: {info['description']}\n"
-                
-                # Show example orchestrations
-                if 'pdf' in query_lower and 'marker' in name:
-                    content += "**Example**: `/hub:orchestrate \"convert document.pdf to markdown\"`\n"
-                elif 'security' in query_lower and 'sparta' in name:
-                    content += "**Example**: `/hub:orchestrate \"analyze security vulnerabilities\"`\n"
-                elif 'video' in query_lower and 'youtube' in name:
-                    content += "**Example**: `/hub:orchestrate \"find videos about topic\"`\n"
-                
-                content += "\n"
-            
-            suggestions = {
-                "/hub:orchestrate": f"Use these modules for {query}",
-                "/hub:best-module": f"Find best module for {query}"
-            }
+        suggestions = _NO_MATCH_SUGGESTIONS
+
+    return format_prompt_response(
+        content=parts,
+        suggestions=suggestions
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _discover_header(name: str, description: str, compliant: int) -> str:
+    """A module's heading and purpose in hub:discover search results; reused across queries"""
+    return f"## {name} {'✅' if compliant else '🔄'}\n**Purpose**: {description}\n"
+
+
+@functools.lru_cache(maxsize=1)
+def _discover_all_response(version: int, epoch: int) -> str:
+    """The complete module listing for hub:discover; cached per registry version and TTL window"""
+    
+    # List all modules
+    spokes = _spokes()
+    parts = ["# All Available Spoke Modules\n\n"]
+    
+    for i, name in enumerate(spokes.names):
+        mcp_status = "✅" if spokes.compliant[i] else "🔄"
+        parts.append(f"## {name} {mcp_status}\n**Purpose**: {spokes.descs[i]}\n**Path**: `{spokes.paths[i]}`\n")
         
-        else:
-            content += f"No modules found matching '{query}'.\n\n"
-            content += "Try:\n"
-            content += "- Using different keywords\n"
-            content += "- `/hub:discover --list-all` to see all modules\n"
-            content += "- `/hub:capabilities` for complete overview\n"
-            
-            suggestions = {
-                "/hub:discover --list-all": "See all modules",
-                "/hub:capabilities": "View hub overview"
-            }
+        # Add capability tags
+        caps = _capability_tags(spokes.descs[i])
+        if caps:
+            parts.append(f"**Capabilities**: {', '.join(caps)}\n")
+        parts.append("\n")
     
+    suggestions = {
+        "/hub:orchestrate": "Start using modules",
+        "/hub:status": "Check module health"
+    }
+
     return format_prompt_response(
-        content=content,
+        content=parts,
         suggestions=suggestions
     )
 
 
+# Most hub:orchestrate steps in flight at once, as the hub's max_parallel_operations
+_MAX_PARALLEL_STEPS = 10
+
+# Modules whose output a hub:orchestrate step consumes, when both are in the plan
+_MODULE_DEPS: Dict[str, frozenset] = {
+    "sparta": frozenset({"marker"}),
+    "claude_max_proxy": frozenset({"marker", "arxiv-mcp-server", "youtube_transcripts"}),
+    "arangodb": frozenset({"marker", "sparta", "arxiv-mcp-server", "youtube_transcripts", "claude_max_proxy"}),
+    "test_reporter": frozenset({"sparta", "claude_max_proxy", "arangodb"}),
+}
+
+
+def _execution_layers(modules: List[str]) -> List[List[int]]:
+    """
+    Group plan positions into layers with Kahn's algorithm: every step only
+    depends on steps in earlier layers, so a layer can run concurrently
+    """
+    positions: Dict[str, List[int]] = defaultdict(list)
+    for i, module in enumerate(modules):
+        positions[module].append(i)
+    
+    in_degree = [0] * len(modules)
+    successors: List[List[int]] = [[] for _ in modules]
+    for i, module in enumerate(modules):
+        for dep in _MODULE_DEPS.get(module, ()):
+            for j in positions.get(dep, ()):
+                successors[j].append(i)
+                in_degree[i] += 1
+    
+    layers = []
+    layer = [i for i, degree in enumerate(in_degree) if not degree]
+    while layer:
+        layers.append(layer)
+        ready = []
+        for i in layer:
+            for k in successors[i]:
+                in_degree[k] -= 1
+                if not in_degree[k]:
+                    ready.append(k)
+        layer = sorted(ready)
+    return layers
+
+
+async def _run_module(module: str, purpose: str) -> tuple[Dict[str, Any], str]:
+    """Simulated execution of one workflow step: its result and progress line"""
+    if module == "marker":
+        return {
+            "status": "success",
+            "output": "markdown_content",
+            "pages": 42,
+            "tables_found": 5
+        }, "✅ Converted 42 pages with 5 tables"
+    
+    if module == "sparta":
+        return {
+            "status": "success",
+            "vulnerabilities": 3,
+            "risk_level": "medium"
+        }, "✅ Found 3 vulnerabilities (Medium risk)"
+    
+    if module == "youtube_transcripts":
+        return {
+            "status": "success",
+            "videos_found": 15,
+            "total_duration": "3h 42m"
+        }, "✅ Found 15 relevant videos (3h 42m total)"
+    
+    return {"status": "success"}, f"✅ Completed {purpose}"
+
+
+async def _run_layer(steps: List[tuple[str, str]], sem: asyncio.Semaphore) -> List[tuple[Dict[str, Any], str]]:
+    """Run one dependency layer, sem bounding how many steps run at once; the first failure cancels the rest"""
+    async def run(module: str, purpose: str) -> tuple[Dict[str, Any], str]:
+        async with sem:
+            return await _run_module(module, purpose)
+    
+    if hasattr(asyncio, "TaskGroup"):
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(run(*step)) for step in steps]
+        except BaseExceptionGroup as group:  # noqa: F821 - builtin from 3.11, like TaskGroup
+            raise group.exceptions[0] from None
+        return [task.result() for task in tasks]
+    
+    # Python 3.10 has no TaskGroup
+    tasks = [asyncio.ensure_future(run(*step)) for step in steps]
+    try:
+        return await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
 @mcp_prompt(
     name="hub:orchestrate",
     description="Orchestrate a workflow across multiple spoke modules",
@@ -599,135 +1029,76 @@ async def orchestrate_workflow(
 ) -> str:
     """Orchestrate a complex workflow across modules"""
     
-    content = f"# Orchestrating: {task}\n\n"
-    
-    # Analyze task to determine required modules
-    task_lower = task.lower()
-    workflow_modules = []
+    spokes = _spokes()
+    parts = [f"# Orchestrating: {task}\n\n"]
     
-    # PDF Processing Detection
-    if any(word in task_lower for word in ['pdf', 'document', 'paper', 'convert']):
-        workflow_modules.append(('marker', 'Convert PDF to Markdown'))
-    
-    # Security Analysis Detection
-    if any(word in task_lower for word in ['security', 'vulnerab', 'cyber', 'threat']):
-        workflow_modules.append(('sparta', 'Analyze security aspects'))
-    
-    # Research Detection
-    if any(word in task_lower for word in ['research', 'paper', 'arxiv', 'academic']):
-        workflow_modules.append(('arxiv-mcp-server', 'Search research papers'))
-    
-    # Video/Transcript Detection
-    if any(word in task_lower for word in ['video', 'youtube', 'transcript', 'watch']):
-        workflow_modules.append(('youtube_transcripts', 'Search video content'))
-    
-    # AI Analysis Detection
-    if any(word in task_lower for word in ['analyze', 'summary', 'extract', 'understand']):
-        workflow_modules.append(('claude_max_proxy', 'AI-powered analysis'))
-    
-    # Storage Detection
-    if any(word in task_lower for word in ['store', 'save', 'graph', 'knowledge']):
-        workflow_modules.append(('arangodb', 'Store in knowledge graph'))
-    
-    # Report Detection
-    if any(word in task_lower for word in ['report', 'test', 'results', 'summary']):
-        workflow_modules.append(('test_reporter', 'Generate report'))
-    
-    # Override with specific modules if provided
+    # Use the given modules, or work out the required ones from the task
     if modules:
-        workflow_modules = [(m, SPOKE_MODULES.get(m, {}).get('description', 'Custom module')) 
-                           for m in modules]
+        workflow_modules = [(m, spokes.descs[i] if (i := spokes.position.get(m)) is not None else 'Custom module')
+                            for m in modules]
+    else:
+        workflow_modules = [(module, purpose) for module, purpose, _ in
+                            _matched_rules(task.lower(), _ORCHESTRATE_RULES, _ORCHESTRATE_MATCHER)]
     
     if not workflow_modules:
-        content += "❌ Could not determine required modules for this task.\n\n"
-        content += "Please be more specific or specify modules directly:\n"
-        content += '`/hub:orchestrate "your task" --modules ["marker", "sparta"]`'
+        parts.append("❌ Could not determine required modules for this task.\n\n"
+                     "Please be more specific or specify modules directly:\n"
+                     '`/hub:orchestrate "your task" --modules ["marker", "sparta"]`')
         
         return format_prompt_response(
-            content=content,
-            suggestions={
-                "/hub:discover": "Find appropriate modules",
-                "/hub:help": "Get task-specific help"
-            }
+            content=parts,
+            suggestions=_NO_PLAN_SUGGESTIONS
         )
     
     # Show execution plan
-    content += "## Execution Plan\n\n"
-    content += f"Mode: {'Parallel' if parallel and len(workflow_modules) > 1 else 'Sequential'}\n\n"
+    parts.append(f"## Execution Plan\n\nMode: {'Parallel' if parallel and len(workflow_modules) > 1 else 'Sequential'}\n\n")
     
     for i, (module, purpose) in enumerate(workflow_modules, 1):
-        mcp_icon = "✅" if SPOKE_MODULES.get(module, {}).get("mcp_compliant") else "🔄"
-        content += f"{i}. **{module}** {mcp_icon}\n"
-        content += f"   → {purpose}\n"
+        position = spokes.position.get(module)
+        mcp_icon = "✅" if position is not None and spokes.compliant[position] else "🔄"
+        parts.append(f"{i}. **{module}** {mcp_icon}\n   → {purpose}\n")
     
     # Simulate execution
-    content += "\n## Execution Progress\n\n"
+    parts.append("\n## Execution Progress\n\n")
     
-    start_time = datetime.now()
+    start_ns = time.perf_counter_ns()
     results = {}
     
-    for module, purpose in workflow_modules:
-        content += f"### {module}\n"
-        content += f"🔄 Executing: {purpose}...\n"
-        
-        # Simulate module-specific results
-        if module == "marker":
-            results[module] = {
-                "status": "success",
-                "output": "markdown_content",
-                "pages": 42,
-                "tables_found": 5
-            }
-            content += "✅ Converted 42 pages with 5 tables\n"
-        
-        elif module == "sparta":
-            results[module] = {
-                "status": "success",
-                "vulnerabilities": 3,
-                "risk_level": "medium"
-            }
-            content += "✅ Found 3 vulnerabilities (Medium risk)\n"
-        
-        elif module == "youtube_transcripts":
-            results[module] = {
-                "status": "success",
-                "videos_found": 15,
-                "total_duration": "3h 42m"
-            }
-            content += "✅ Found 15 relevant videos (3h 42m total)\n"
-        
-        else:
-            results[module] = {"status": "success"}
-            content += f"✅ Completed {purpose}\n"
-        
-        content += "\n"
+    # Run each dependency layer concurrently; progress is reported in plan order
+    outcomes: List[Any] = [None] * len(workflow_modules)
+    if parallel:
+        sem = asyncio.Semaphore(_MAX_PARALLEL_STEPS)
+        for layer in _execution_layers([module for module, _ in workflow_modules]):
+            done = await _run_layer([workflow_modules[i] for i in layer], sem)
+            for i, outcome in zip(layer, done):
+                outcomes[i] = outcome
+    else:
+        for i, (module, purpose) in enumerate(workflow_modules):
+            outcomes[i] = await _run_module(module, purpose)
+    
+    for (module, purpose), (result, progress) in zip(workflow_modules, outcomes):
+        results[module] = result
+        parts.append(f"### {module}\n🔄 Executing: {purpose}...\n{progress}\n\n")
     
     # Summary
-    elapsed = (datetime.now() - start_time).total_seconds()
-    content += f"## Workflow Complete\n\n"
-    content += f"- **Total Time**: {elapsed:.1f}s\n"
-    content += f"- **Modules Used**: {len(workflow_modules)}\n"
-    content += f"- **Status**: ✅ All steps successful\n"
+    elapsed = (time.perf_counter_ns() - start_ns) / 1e9
+    parts.append(f"## Workflow Complete\n\n"
+                 f"- **Total Time**: {elapsed:.1f}s\n"
+                 f"- **Modules Used**: {len(workflow_modules)}\n"
+                 f"- **Status**: ✅ All steps successful\n"
+                 "\n## Results Summary\n\n")
     
     # Next steps based on results
-    content += "\n## Results Summary\n\n"
-    
     if 'marker' in [m[0] for m in workflow_modules]:
-        content += "- Document converted to Markdown\n"
+        parts.append("- Document converted to Markdown\n")
     if 'sparta' in [m[0] for m in workflow_modules]:
-        content += "- Security analysis complete\n"
+        parts.append("- Security analysis complete\n")
     if 'youtube_transcripts' in [m[0] for m in workflow_modules]:
-        content += "- Video content discovered\n"
-    
-    suggestions = {
-        "/hub:workflow-save": "Save this workflow",
-        "/hub:status": "Check module details",
-        "/hub:orchestrate": "Run another workflow"
-    }
+        parts.append("- Video content discovered\n")
     
     return format_prompt_response(
-        content=content,
-        suggestions=suggestions,
+        content=parts,
+        suggestions=_WORKFLOW_SUGGESTIONS,
         data={"results": results, "execution_time": elapsed}
     )
 
@@ -740,55 +1111,56 @@ async def orchestrate_workflow(
 async def check_status() -> str:
     """Check the status of all connected modules"""
     
-    content = "# Module Status Report\n\n"
-    content += f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    content = (f"# Module Status Report\n\n"
+               f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+               f"{_status_report(_REGISTRY_VERSION, _render_epoch())}")
+    
+    return format_prompt_response(
+        content=content,
+        suggestions=_STATUS_SUGGESTIONS
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _status_report(version: int, epoch: int) -> str:
+    """hub:status body below the Generated line; cached like the renders"""
     
     # Overall statistics
-    total = len(SPOKE_MODULES)
-    mcp_ready = sum(1 for m in SPOKE_MODULES.values() if m.get("mcp_compliant"))
+    total, mcp_ready = _registry_counts(version, epoch)
     
-    content += "## Overall Health\n\n"
-    content += f"- **Total Modules**: {total}\n"
-    content += f"- **MCP Ready**: {mcp_ready}/{total} ({mcp_ready/total*100:.0f}%)\n"
-    content += f"- **Hub Status**: 🟢 Operational\n\n"
+    parts = [f"## Overall Health\n\n"
+             f"- **Total Modules**: {total}\n"
+             f"- **MCP Ready**: {mcp_ready}/{total} ({mcp_ready/total*100:.0f}%)\n"
+             f"- **Hub Status**: 🟢 Operational\n\n"
+             "## Module Details\n\n"]
     
     # Detailed status
-    content += "## Module Details\n\n"
-    
-    for name, info in SPOKE_MODULES.items():
+    spokes = _spokes()
+    for i, name in enumerate(spokes.names):
         # Simulate health check
-        if info.get("mcp_compliant"):
+        if spokes.compliant[i]:
             status = "🟢 Active"
             latency = "12ms"
         else:
             status = "🟡 Legacy Mode"
             latency = "45ms"
         
-        content += f"### {name}\n"
-        content += f"- **Status**: {status}\n"
-        content += f"- **Latency**: {latency}\n"
-        content += f"- **MCP**: {'✅ Compliant' if info.get('mcp_compliant') else '❌ Not Compliant'}\n"
-        content += f"- **Path**: `{info['path']}`\n\n"
+        parts.append(f"### {name}\n"
+                     f"- **Status**: {status}\n"
+                     f"- **Latency**: {latency}\n"
+                     f"- **MCP**: {'✅ Compliant' if spokes.compliant[i] else '❌ Not Compliant'}\n"
+                     f"- **Path**: `{spokes.paths[i]}`\n\n")
     
     # Recommendations
-    content += "## Recommendations\n\n"
+    parts.append("## Recommendations\n\n")
     
     if mcp_ready < total:
-        content += f"- 🔄 {total - mcp_ready} modules need MCP migration\n"
-        content += "- Run `/hub:migrate-status` for migration progress\n"
+        parts.append(f"- 🔄 {total - mcp_ready} modules need MCP migration\n"
+                     "- Run `/hub:migrate-status` for migration progress\n")
     else:
-        content += "- ✅ All modules are MCP compliant!\n"
-    
-    suggestions = {
-        "/hub:orchestrate": "Start using modules",
-        "/hub:capabilities": "View all features",
-        "/hub:help": "Get assistance"
-    }
+        parts.append("- ✅ All modules are MCP compliant!\n")
     
-    return format_prompt_response(
-        content=content,
-        suggestions=suggestions
-    )
+    return "".join(parts)
 
 
 @mcp_prompt(
@@ -802,72 +1174,40 @@ async def check_status() -> str:
 async def find_best_module(task: str) -> str:
     """Intelligently recommend the best module(s) for a task"""
     
-    content = f"# Best Module Analysis\n\n"
-    content += f"**Task**: {task}\n\n"
-    
-    # Analyze task
-    task_lower = task.lower()
-    recommendations = []
-    
-    # PDF-related tasks
-    if any(word in task_lower for word in ['pdf', 'document', 'convert', 'markdown']):
-        recommendations.append({
-            "module": "marker",
-            "score": 95,
-            "reason": "Specialized PDF to Markdown conversion with AI assistance"
-        })
-    
-    # Security tasks
-    if any(word in task_lower for word in ['security', 'vulnerab', 'cyber', 'threat', 'risk']):
-        recommendations.append({
-            "module": "sparta",
-            "score": 90,
-            "reason": "Space cybersecurity expertise and vulnerability analysis"
-        })
-    
-    # Research tasks
-    if any(word in task_lower for word in ['research', 'paper', 'academic', 'arxiv', 'study']):
-        recommendations.append({
-            "module": "arxiv-mcp-server",
-            "score": 85,
-            "reason": "Direct access to research papers and academic content"
-        })
-    
-    # Video/Transcript tasks
-    if any(word in task_lower for word in ['video', 'youtube', 'transcript', 'watch', 'tutorial']):
-        recommendations.append({
-            "module": "youtube_transcripts",
-            "score": 90,
-            "reason": "Specialized YouTube transcript search and analysis"
-        })
-    
-    # Sort by score
-    recommendations.sort(key=lambda x: x['score'], reverse=True)
+    parts = [f"# Best Module Analysis\n\n**Task**: {task}\n\n"]
+    
+    # Analyze task; walking the precomputed ranking yields the matches best first
+    hit = _BEST_MODULE_MATCHER(task.lower())
+    recommendations = [
+        {"module": module, "score": score, "reason": reason}
+        for module, score, reason, _ in
+        (_BEST_MODULE_RULES[i] for i in _BEST_MODULE_RANKING if i in hit)
+    ]
     
     if recommendations:
-        content += "## Recommended Modules\n\n"
+        parts.append("## Recommended Modules\n\n")
         
         for i, rec in enumerate(recommendations[:3], 1):
-            module_info = SPOKE_MODULES.get(rec['module'], {})
-            mcp_status = "✅" if module_info.get('mcp_compliant') else "🔄"
+            module_info = _spoke(rec['module'])
+            mcp_status = "✅" if module_info and module_info.mcp_compliant else "🔄"
             
-            content += f"### {i}. {rec['module']} (Score: {rec['score']}/100) {mcp_status}\n"
-            content += f"**Why**: {rec['reason']}\n"
-            content += f"**Description**: {module_info.get('description', 'N/A')}\n\n"
+            parts.append(f"### {i}. {rec['module']} (Score: {rec['score']}/100) {mcp_status}\n"
+                         f"**Why**: {rec['reason']}\n"
+                         f"**Description**: {module_info.description if module_info else 'N/A'}\n\n")
         
         # Suggest orchestration
         if len(recommendations) > 1:
             modules_list = [r['module'] for r in recommendations[:2]]
-            content += "## Suggested Workflow\n\n"
-            content += "These modules could work together:\n"
-            content += f"`/hub:orchestrate \"{task}\" --modules {modules_list}`\n"
+            parts.append("## Suggested Workflow\n\n"
+                         "These modules could work together:\n"
+                         f"`/hub:orchestrate \"{task}\" --modules {modules_list}`\n")
     
     else:
-        content += "## No Direct Match\n\n"
-        content += "No modules directly match your task. Try:\n"
-        content += "1. Breaking down the task into smaller steps\n"
-        content += "2. Using `/hub:discover` with different keywords\n"
-        content += "3. Asking `/hub:help` for guidance\n"
+        parts.append("## No Direct Match\n\n"
+                     "No modules directly match your task. Try:\n"
+                     "1. Breaking down the task into smaller steps\n"
+                     "2. Using `/hub:discover` with different keywords\n"
+                     "3. Asking `/hub:help` for guidance\n")
     
     suggestions = {
         "/hub:orchestrate": f"Execute '{task}'",
@@ -876,7 +1216,7 @@ async def find_best_module(task: str) -> str:
     }
     
     return format_prompt_response(
-        content=content,
+        content=parts,
         suggestions=suggestions,
         data={"recommendations": recommendations}
     )
@@ -35,6 +35,26 @@ except ImportError:
             self.registry = registry
 
 
+# Response envelope returned by process(); the same for every instance
+_OUTPUT_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "success": {"type": "boolean"},
+        "module": {"type": "string"},
+        "action": {"type": "string"},
+        "data": {
+            "type": "object",
+            "description": "Action-specific response data"
+        },
+        "error": {
+            "type": "string",
+            "description": "Error message if success is false"
+        }
+    },
+    "required": ["success", "module"]
+}
+
+
 class YoutubeTranscriptsModule(BaseModule):
     """Youtube Transcripts module for claude-module-communicator"""
 
@@ -59,6 +79,30 @@ class YoutubeTranscriptsModule(BaseModule):
         # Initialize components
         self._initialized = False
 
+        self._capabilities_set = frozenset(self.capabilities)
+
+        # Schemas are fixed once the capabilities are, so build them once
+        self._input_schema: dict[str, Any] = {
+            "type": "object",
+            "properties": {
+                "action": {
+                    "type": "string",
+                    "enum": list(self.capabilities)
+                },
+                "data": {
+                    "type": "object",
+                    "description": "Action-specific data"
+                }
+            },
+            "required": ["action"]
+        }
+
+        # Resolve each capability's handler once instead of per request
+        self._handlers = {
+            action: handler for action in self.capabilities
+            if (handler := getattr(self, f"_handle_{action}", None))
+        }
+
     async def start(self) -> None:
         """Initialize the module"""
         if not self._initialized:
@@ -80,7 +124,9 @@ class YoutubeTranscriptsModule(BaseModule):
         try:
             action = request.get("action")
 
-            if action not in self.capabilities:
+            # Only strings can name a capability; this also keeps unhashable
+            # actions out of the set lookup
+            if not isinstance(action, str) or action not in self._capabilities_set:
                 return {
                     "success": False,
                     "error": f"Unknown action: {action}",
@@ -107,47 +153,16 @@ class YoutubeTranscriptsModule(BaseModule):
 
     def get_input_schema(self) -> dict[str, Any] | None:
         """Get the input schema for the module"""
-        return {
-            "type": "object",
-            "properties": {
-                "action": {
-                    "type": "string",
-                    "enum": self.capabilities
-                },
-                "data": {
-                    "type": "object",
-                    "description": "Action-specific data"
-                }
-            },
-            "required": ["action"]
-        }
+        return self._input_schema
 
     def get_output_schema(self) -> dict[str, Any] | None:
         """Get the output schema for the module"""
-        return {
-            "type": "object",
-            "properties": {
-                "success": {"type": "boolean"},
-                "module": {"type": "string"},
-                "action": {"type": "string"},
-                "data": {
-                    "type": "object",
-                    "description": "Action-specific response data"
-                },
-                "error": {
-                    "type": "string",
-                    "description": "Error message if success is false"
-                }
-            },
-            "required": ["success", "module"]
-        }
+        return _OUTPUT_SCHEMA
 
     async def _route_action(self, action: str, request: dict[str, Any]) -> dict[str, Any]:
         """Route actions to appropriate handlers"""
 
-        # Map actions to handler methods
-        handler_name = f"_handle_{action}"
-        handler = getattr(self, handler_name, None)
+        handler = self._handlers.get(action)
 
         if not handler:
             # Default handler for unimplemented actions
@@ -165,7 +180,8 @@ class YoutubeTranscriptsModule(BaseModule):
 
     async def _handle_fetch_transcript(self, request: dict[str, Any]) -> dict[str, Any]:
         """Handle fetch_transcript action"""
-        video_id = request.get("data", {}).get("video_id")
+        data = request.get("data", {})
+        video_id = data.get("video_id")
 
         if not video_id:
             raise ValueError("video_id is required")
@@ -183,8 +199,9 @@ class YoutubeTranscriptsModule(BaseModule):
 
     async def _handle_search_transcripts(self, request: dict[str, Any]) -> dict[str, Any]:
         """Handle search_transcripts action"""
-        query = request.get("data", {}).get("query")
-        limit = request.get("data", {}).get("limit", 10)
+        data = request.get("data", {})
+        query = data.get("query")
+        limit = data.get("limit", 10)
 
         if not query:
             raise ValueError("query is required")
@@ -200,8 +217,9 @@ class YoutubeTranscriptsModule(BaseModule):
 
     async def _handle_get_channel_videos(self, request: dict[str, Any]) -> dict[str, Any]:
         """Handle get_channel_videos action"""
-        channel_id = request.get("data", {}).get("channel_id")
-        limit = request.get("data", {}).get("limit", 50)
+        data = request.get("data", {})
+        channel_id = data.get("channel_id")
+        limit = data.get("limit", 50)
 
         if not channel_id:
             raise ValueError("channel_id is required")
@@ -217,8 +235,9 @@ class YoutubeTranscriptsModule(BaseModule):
 
     async def _handle_extract_keywords(self, request: dict[str, Any]) -> dict[str, Any]:
         """Handle extract_keywords action"""
-        transcript = request.get("data", {}).get("transcript")
-        video_id = request.get("data", {}).get("video_id")
+        data = request.get("data", {})
+        transcript = data.get("transcript")
+        video_id = data.get("video_id")
 
         if not transcript and not video_id:
             raise ValueError("Either transcript or video_id is required")
@@ -233,9 +252,10 @@ class YoutubeTranscriptsModule(BaseModule):
 
     async def _handle_summarize_video(self, request: dict[str, Any]) -> dict[str, Any]:
         """Handle summarize_video action"""
-        video_id = request.get("data", {}).get("video_id")
-        transcript = request.get("data", {}).get("transcript")
-        summary_type = request.get("data", {}).get("summary_type", "brief")
+        data = request.get("data", {})
+        video_id = data.get("video_id")
+        transcript = data.get("transcript")
+        summary_type = data.get("summary_type", "brief")
 
         if not video_id and not transcript:
             raise ValueError("Either video_id or transcript is required")
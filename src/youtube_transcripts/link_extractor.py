@@ -7,6 +7,7 @@ External Dependencies:
 - linkify-it-py: https://pypi.org/project/linkify-it-py/
 - validators: https://pypi.org/project/validators/
 - loguru: https://pypi.org/project/loguru/
+- google-re2 (optional): https://pypi.org/project/google-re2/
 
 Sample Input:
 >>> text = "Check out https://github.com/openai/gpt-4 and arXiv:2301.12345"
@@ -22,14 +23,39 @@ Example Usage:
 """
 
 import re
+import threading
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List
 
 from linkify_it import LinkifyIt
 from loguru import logger
 
+# RE2 matches in linear time; the patterns below carry their flags inline
+# so either engine compiles them
+try:
+    import re2 as _regex
+    HAS_RE2 = True
+except ImportError:
+    _regex = re
+    HAS_RE2 = False
 
-@dataclass
+# Built once; match() keeps scan state on the instance in some linkify-it-py
+# releases, so calls are serialized
+_LINKIFY = LinkifyIt()
+_LINKIFY_LOCK = threading.Lock()
+
+# Every link kept below contains one of these, so text without either has
+# nothing to extract and skips both scans
+_LINK_HINT_RE = _regex.compile(r'(?i)github\.com|arxiv')
+
+_GITHUB_RE = _regex.compile(r'(?i)https?://github\.com/([\w-]+/[\w.-]+)')
+_ARXIV_ID_RE = _regex.compile(r'(?i)arXiv:\s*(\d+\.\d+(?:v\d+)?)')
+
+# Same as 'arxiv.org' in url.lower() without building the lowercase copy
+_ARXIV_HOST_RE = re.compile(r'arxiv\.org', re.IGNORECASE | re.ASCII)
+
+
+@dataclass(slots=True, frozen=True)
 class ExtractedLink:
     """Represents an extracted link with metadata."""
     url: str
@@ -50,64 +76,49 @@ def extract_links_from_text(text: str, source: str, is_authoritative: bool = Fal
     Returns:
         List of ExtractedLink objects
     """
-    # Initialize linkify-it
-    linkify = LinkifyIt()
+    if not _LINK_HINT_RE.search(text):
+        return []
     
     # Find all links
-    matches = linkify.match(text) or []
+    with _LINKIFY_LOCK:
+        matches = _LINKIFY.match(text) or []
     
-    extracted_links = []
-    seen_urls = set()  # To avoid duplicates
+    # URL -> link type in first-seen order; setdefault drops duplicates
+    # with a single lookup
+    found: Dict[str, str] = {}
     
     for match in matches:
         url = match.url
         
         # Normalize GitHub URLs to just owner/repo
-        github_match = re.match(r'https?://github\.com/([\w-]+/[\w.-]+)', url, re.IGNORECASE)
+        github_match = _GITHUB_RE.match(url)
         if github_match:
-            canonical_url = f'https://github.com/{github_match.group(1)}'
-            if canonical_url not in seen_urls:
-                seen_urls.add(canonical_url)
-                extracted_links.append(ExtractedLink(
-                    url=canonical_url,
-                    link_type='github',
-                    source=source,
-                    is_authoritative=is_authoritative
-                ))
+            found.setdefault(f'https://github.com/{github_match.group(1)}', 'github')
             continue
         
         # Check for arXiv links
-        if 'arxiv.org' in url.lower():
+        if _ARXIV_HOST_RE.search(url):
             # Normalize to abs URL if it's a PDF link
             url = url.replace('/pdf/', '/abs/')
             # Ensure HTTPS
             if url.startswith('http://'):
                 url = url.replace('http://', 'https://')
-            if url not in seen_urls:
-                seen_urls.add(url)
-                extracted_links.append(ExtractedLink(
-                    url=url,
-                    link_type='arxiv',
-                    source=source,
-                    is_authoritative=is_authoritative
-                ))
+            found.setdefault(url, 'arxiv')
             continue
     
     # Also check for arXiv:XXXX.XXXX format
-    arxiv_pattern = r'arXiv:\s*(\d+\.\d+(?:v\d+)?)'
-    for match in re.finditer(arxiv_pattern, text, re.IGNORECASE):
-        arxiv_id = match.group(1)
-        arxiv_url = f'https://arxiv.org/abs/{arxiv_id}'
-        if arxiv_url not in seen_urls:
-            seen_urls.add(arxiv_url)
-            extracted_links.append(ExtractedLink(
-                url=arxiv_url,
-                link_type='arxiv',
-                source=source,
-                is_authoritative=is_authoritative
-            ))
+    for match in _ARXIV_ID_RE.finditer(text):
+        found.setdefault(f'https://arxiv.org/abs/{match.group(1)}', 'arxiv')
     
-    return extracted_links
+    return [
+        ExtractedLink(
+            url=url,
+            link_type=link_type,
+            source=source,
+            is_authoritative=is_authoritative
+        )
+        for url, link_type in found.items()
+    ]
 
 
 def categorize_links(links: List[ExtractedLink]) -> dict:
@@ -120,12 +131,24 @@ def categorize_links(links: List[ExtractedLink]) -> dict:
     Returns:
         Dictionary with categorized links
     """
-    return {
-        'github_authoritative': [l for l in links if l.link_type == 'github' and l.is_authoritative],
-        'github_community': [l for l in links if l.link_type == 'github' and not l.is_authoritative],
-        'arxiv_authoritative': [l for l in links if l.link_type == 'arxiv' and l.is_authoritative],
-        'arxiv_community': [l for l in links if l.link_type == 'arxiv' and not l.is_authoritative],
+    categorized = {
+        'github_authoritative': [],
+        'github_community': [],
+        'arxiv_authoritative': [],
+        'arxiv_community': [],
+    }
+    # (link_type, is_authoritative) -> bucket, so one pass fills all four
+    buckets = {
+        ('github', True): categorized['github_authoritative'],
+        ('github', False): categorized['github_community'],
+        ('arxiv', True): categorized['arxiv_authoritative'],
+        ('arxiv', False): categorized['arxiv_community'],
     }
+    for link in links:
+        bucket = buckets.get((link.link_type, bool(link.is_authoritative)))
+        if bucket is not None:
+            bucket.append(link)
+    return categorized
 
 
 if __name__ == "__main__":
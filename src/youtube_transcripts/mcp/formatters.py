@@ -23,17 +23,22 @@ from typing import Any
 def format_search_results(results: list[dict[str, Any]], query: str) -> dict[str, Any]:
     """Format search results for MCP response"""
     formatted_results = []
+    snippet_length = 200
+
+    # A query with no cased characters matches the transcript as-is, so the
+    # lowercase copy of each transcript is only made when it can matter
+    query_lower = query.lower()
+    query_cased = query_lower != query.upper()
 
     for result in results:
         # Create snippet from transcript
         transcript = result.get('transcript', '')
-        snippet_length = 200
 
         # Try to find query terms in transcript for better snippet
-        query_lower = query.lower()
-        transcript_lower = transcript.lower()
-
-        start_idx = transcript_lower.find(query_lower)
+        if query_cased:
+            start_idx = transcript.lower().find(query_lower)
+        else:
+            start_idx = transcript.find(query)
         if start_idx != -1:
             # Center snippet around query match
             start = max(0, start_idx - snippet_length // 2)
@@ -23,7 +23,7 @@ Example Usage:
 import asyncio
 import inspect
 import json
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from typing import Any, Protocol, TypeVar
 
@@ -235,7 +235,7 @@ def get_prompt_registry() -> PromptRegistry:
 
 
 def format_prompt_response(
-    content: str,
+    content: str | Iterable[str],
     next_steps: list[str] | None = None,
     suggestions: dict[str, str] | None = None,
     data: dict[str, Any] | None = None
@@ -244,7 +244,8 @@ def format_prompt_response(
     Format a prompt response with guidance for the agent
     
     Args:
-        content: Main response content
+        content: Main response content, or its chunks in order; chunks are
+            joined straight into the response without an interim string
         next_steps: List of suggested next actions
         suggestions: Dict of command suggestions
         data: Additional structured data
@@ -252,7 +253,7 @@ def format_prompt_response(
     Returns:
         Formatted response string
     """
-    parts = [content]
+    parts = []
 
     if data:
         parts.append("\n## Data")
@@ -268,7 +269,14 @@ def format_prompt_response(
         for cmd, desc in suggestions.items():
             parts.append(f"- `{cmd}` - {desc}")
 
-    return "\n".join(parts)
+    if isinstance(content, str):
+        return "\n".join([content, *parts])
+
+    chunks = list(content)
+    if parts:
+        chunks.append("\n")
+        chunks.append("\n".join(parts))
+    return "".join(chunks)
 
 
 # Validation
@@ -27,10 +27,25 @@ class UnifiedSearchConfig:
     use_lora: bool = True
     lora_adapter_path: str | None = "/home/graham/workspace/experiments/unsloth_wip/lora_model"
 
+    # Query optimizer backend: "ollama" or "llama.cpp"
+    backend: str = "ollama"
+    llama_server_url: str = "http://localhost:8080"  # llama-server (llama.cpp)
+    model_keep_alive: str = "1h"  # How long Ollama keeps the model loaded between calls
+
     # DeepRetrieval settings
     deepretrieval_endpoint: str = "http://localhost:8000"  # vLLM endpoint
     use_reasoning: bool = True  # Use <think> tags
 
+    # Query optimization cache
+    optimization_cache_ttl: int = 3600  # Seconds; 0 disables caching
+    use_semantic_cache: bool = False  # Also reuse results for near-duplicate queries
+    semantic_cache_model: str = "all-MiniLM-L6-v2"
+    semantic_cache_threshold: float = 0.92  # Minimum cosine similarity for a hit
+
+    # Entity types extracted for graph memory; None enables all of
+    # youtube_channel, person, organization, technical_term and topic
+    entity_types: list[str] | None = None
+
     # ArangoDB settings
     arango_host: str = "http://localhost:8529"
     arango_db: str = "memory_bank"
@@ -68,6 +83,7 @@ if __name__ == "__main__":
     print("Unified Search Configuration:")
     print(f"  Ollama Model: {config.ollama_model}")
     print(f"  Use LoRA: {config.use_lora}")
+    print(f"  Optimizer Backend: {config.backend}")
     print(f"  DeepRetrieval Endpoint: {config.deepretrieval_endpoint}")
     print(f"  ArangoDB Host: {config.arango_host}")
     print(f"  YouTube API Key: {'Set' if config.youtube_api_key else 'Not Set'}")
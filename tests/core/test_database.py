@@ -14,6 +14,8 @@ import json
 from youtube_transcripts.core.database import (
     initialize_database,
     add_transcript,
+    add_transcripts,
+    check_transcript_exists,
     search_transcripts,
     cleanup_old_transcripts
 )
@@ -213,6 +215,27 @@ class TestDatabaseOperations:
         results = search_transcripts("Modern", db_path=test_db)
         assert len(results) == 1, "Recent transcript was incorrectly deleted"
 
+    def test_add_transcripts_batch_on_shared_connection(self, test_db):
+        """Test batched inserts and existence checks through one connection"""
+        rows = [
+            ("batch_a", "First", "Channel", "2025-05-01", "Batched transcript alpha", "", ""),
+            ("batch_b", "Second", "Channel", "2025-05-02", "Batched transcript beta", "", ""),
+        ]
+
+        conn = sqlite3.connect(test_db)
+        try:
+            assert not check_transcript_exists("batch_a", conn=conn)
+            add_transcripts(rows, conn=conn)
+            assert check_transcript_exists("batch_a", conn=conn)
+            assert check_transcript_exists("batch_b", conn=conn)
+        finally:
+            conn.close()
+
+        # Rows are committed and visible to a fresh connection
+        assert check_transcript_exists("batch_b", db_path=test_db)
+        results = search_transcripts("Batched", db_path=test_db)
+        assert len(results) == 2, f"Expected 2 batched transcripts, got {len(results)}"
+
 
 def generate_test_report(test_results):
     """Generate a markdown report for test results"""
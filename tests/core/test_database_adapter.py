@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Real tests for SQLite full-text search through the database adapter
+Following CLAUDE.md: NO MOCKING - queries run against a real FTS5 database
+"""
+
+import pytest
+
+from youtube_transcripts.database_adapter import DatabaseAdapter, SQLiteBackend
+
+VIDEOS = [
+    {
+        'video_id': 'adjacent',
+        'title': 'Intro to Machine Learning',
+        'channel_name': 'AI Academy',
+        'transcript': 'Machine learning lets programs improve from data and examples.',
+    },
+    {
+        'video_id': 'apart',
+        'title': 'Workshop Tour',
+        'channel_name': 'Maker Space',
+        'transcript': 'This machine is loud. Learning to use it takes a day.',
+    },
+    {
+        'video_id': 'paper',
+        'title': 'Attention Is All You Need',
+        'channel_name': 'AI Academy',
+        'transcript': 'We read arXiv:1706.03762 on attention-mechanisms in transformers.',
+    },
+]
+
+
+@pytest.fixture
+async def backend(tmp_path):
+    """A SQLite backend holding the sample videos"""
+    backend = SQLiteBackend(str(tmp_path / "search.db"))
+    await backend.store_transcripts(VIDEOS)
+    yield backend
+    backend.close()
+
+
+async def found(backend, query):
+    return sorted(result['video_id'] for result in await backend.search(query, limit=10))
+
+
+@pytest.mark.parametrize("query, expected", [
+    ('"machine learning"', ['adjacent']),
+    ('machine learning', ['adjacent', 'apart']),
+    ('title:learning', ['adjacent']),
+    ('NEAR(machine learning, 0)', ['adjacent']),
+    ('(loud OR transformers) AND machine', ['apart']),
+    ('arXiv:1706.03762 attention-mechanisms', ['paper']),
+    ('C++ (', []),
+    ('data AND', ['adjacent']),
+])
+async def test_search_query_syntax(backend, query, expected):
+    """FTS5 syntax is honoured; anything else is matched as literal text"""
+    assert await found(backend, query) == expected
+
+
+async def test_find_evidence_keeps_phrases(backend):
+    """Evidence lookup uses the same query handling as search"""
+    evidence = await backend.find_evidence('"machine learning"')
+    assert [item['video_id'] for item in evidence] == ['adjacent']
+
+
+async def test_adapter_cached_reads_are_copies(tmp_path):
+    """Mutating a returned read must not change what later callers get"""
+    adapter = DatabaseAdapter({'backend': 'sqlite', 'sqlite_path': str(tmp_path / "cache.db")})
+    await adapter.store_transcripts(VIDEOS)
+
+    transcript = await adapter.get_transcript('adjacent')
+    transcript['title'] = 'Changed by caller'
+    assert (await adapter.get_transcript('adjacent'))['title'] == 'Intro to Machine Learning'
+
+    related = await adapter.find_related('adjacent')
+    related.clear()
+    assert [video['video_id'] for video in await adapter.find_related('adjacent')] == ['paper']
+    adapter.close()
+
+
+@pytest.mark.parametrize("query, filters, expected", [
+    ('学习', None, ['cjk_ml', 'cjk_study']),
+    ('学习', {'channel': 'AI Academy'}, ['cjk_ml']),
+    ('机器学习', None, ['cjk_ml']),
+    ('学', None, ['cjk_ml', 'cjk_study']),
+])
+async def test_trigram_search_short_cjk_terms(tmp_path, query, filters, expected):
+    """CJK words shorter than a trigram are still found"""
+    backend = SQLiteBackend(str(tmp_path / "cjk.db"), {'fts_trigram': True})
+    await backend.store_transcripts([
+        {'video_id': 'cjk_ml', 'title': '机器学习入门', 'channel_name': 'AI Academy',
+         'transcript': '今天我们讨论机器学习的基础。'},
+        {'video_id': 'cjk_study', 'title': '读书', 'channel_name': 'Study Hall',
+         'transcript': '每天学习一点点。'},
+    ])
+    results = await backend.search(query, limit=10, filters=filters)
+    assert sorted(result['video_id'] for result in results) == expected
+    backend.close()
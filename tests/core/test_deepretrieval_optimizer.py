@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Real tests for batched query optimization against a local chat server
+Following CLAUDE.md: NO MOCKING - the backends talk HTTP to a real server
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from youtube_transcripts import deepretrieval_optimizer as optimizer_module
+from youtube_transcripts.deepretrieval_optimizer import DeepRetrievalQueryOptimizer
+from youtube_transcripts.unified_search_config import UnifiedSearchConfig
+
+ANSWER = "<think>Add implementation terms</think>\n<answer>transformer attention implementation</answer>"
+
+
+class ChatHandler(BaseHTTPRequestHandler):
+    """Answers both the Ollama and the llama-server chat endpoints"""
+
+    # Keep-alive, so a client would reuse its pooled connection across batches
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path == "/api/chat":
+            body = {
+                "model": "test",
+                "created_at": "2025-01-01T00:00:00Z",
+                "message": {"role": "assistant", "content": ANSWER},
+                "done": True
+            }
+        else:
+            body = {"choices": [{"message": {"role": "assistant", "content": ANSWER}}]}
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def chat_server():
+    """A local HTTP chat server on a free port"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ChatHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("backend", ["ollama", "llama.cpp"])
+def test_optimize_queries_sync_twice(chat_server, backend, monkeypatch):
+    """Each sync batch runs its own event loop; the second must still reach the model"""
+    if backend == "ollama":
+        if not optimizer_module.OLLAMA_AVAILABLE:
+            pytest.skip("ollama not installed")
+        monkeypatch.setenv("OLLAMA_HOST", chat_server)
+    elif not optimizer_module.HTTPX_AVAILABLE:
+        pytest.skip("httpx not installed")
+
+    config = UnifiedSearchConfig(backend=backend, llama_server_url=chat_server, optimization_cache_ttl=0)
+    optimizer = DeepRetrievalQueryOptimizer(config)
+
+    for batch in (["transformers", "attention"], ["diffusion models"]):
+        results = optimizer.optimize_queries_sync(batch)
+        assert [r["original"] for r in results] == batch
+        assert all(r["optimized"] == "transformer attention implementation" for r in results)
+        assert all(r["reasoning"] == "Add implementation terms" for r in results)
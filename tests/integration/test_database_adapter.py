@@ -197,6 +197,42 @@ class TestSQLiteBackend:
             )
             raise
     
+    @pytest.mark.asyncio
+    async def test_sqlite_bulk_store(self, sqlite_db_path, sample_video_data, test_report):
+        """Test storing a batch of transcripts in one call"""
+        try:
+            backend = SQLiteBackend(sqlite_db_path)
+            videos = [
+                {**sample_video_data, 'video_id': f'bulk_{i}', 'title': f'Bulk Talk {i}'}
+                for i in range(3)
+            ]
+            
+            doc_ids = await backend.store_transcripts(videos)
+            assert doc_ids == ['bulk_0', 'bulk_1', 'bulk_2'], "Document IDs mismatch"
+            
+            for video in videos:
+                retrieved = await backend.get_transcript(video['video_id'])
+                assert retrieved['title'] == video['title'], "Title mismatch"
+                assert len(retrieved['citations']) == 1, "Citations not stored correctly"
+                assert retrieved['speakers'][0]['name'] == 'Dr. Jane Smith', "Speaker not linked"
+            
+            results = await backend.search("transformers", limit=10)
+            assert len(results) == 3, f"Expected 3 results, got {len(results)}"
+            
+            test_report.add_test(
+                "SQLite Bulk Store",
+                "PASS",
+                "Stored a batch of transcripts in one transaction"
+            )
+        except Exception as e:
+            test_report.add_test(
+                "SQLite Bulk Store",
+                "FAIL",
+                "Failed to bulk store transcripts",
+                str(e)
+            )
+            raise
+    
     @pytest.mark.asyncio
     async def test_sqlite_search(self, sqlite_db_path, sample_video_data, test_report):
         """Test SQLite FTS5 search functionality"""
@@ -217,6 +253,10 @@ class TestSQLiteBackend:
             no_results = await backend.search("nonexistent", limit=10)
             assert len(no_results) == 0, "Should return empty for non-matching query"
             
+            # Test punctuated input is treated as text, not FTS5 syntax
+            punctuated = await backend.search("arXiv:1706.03762 attention-mechanisms", limit=10)
+            assert len(punctuated) == 1, "Punctuated query should match"
+            
             # Test with filters
             filtered_results = await backend.search("transformers", filters={'channel': 'AI Academy'})
             assert len(filtered_results) == 1, "Channel filter not working"
@@ -365,6 +405,44 @@ class TestDatabaseAdapter:
                 str(e)
             )
             raise
+    
+    @pytest.mark.asyncio
+    async def test_adapter_read_cache(self, sqlite_db_path, sample_video_data, test_report):
+        """Test that cached reads are invalidated when a transcript is stored"""
+        try:
+            adapter = DatabaseAdapter({
+                'backend': 'sqlite',
+                'sqlite_path': sqlite_db_path,
+                'cache_ttl': 60
+            })
+            
+            await adapter.store_transcript(sample_video_data)
+            first = await adapter.get_transcript(sample_video_data['video_id'])
+            second = await adapter.get_transcript(sample_video_data['video_id'])
+            assert first == second, "Second read should be served from cache"
+            
+            first['title'] = 'Changed by caller'
+            third = await adapter.get_transcript(sample_video_data['video_id'])
+            assert third['title'] == sample_video_data['title'], "Callers must not share the cached dict"
+            
+            updated = {**sample_video_data, 'title': 'Updated Title'}
+            await adapter.store_transcript(updated)
+            refreshed = await adapter.get_transcript(sample_video_data['video_id'])
+            assert refreshed['title'] == 'Updated Title', "Store should invalidate the cache"
+            
+            test_report.add_test(
+                "Adapter Read Cache",
+                "PASS",
+                "Cached reads served and invalidated on store"
+            )
+        except Exception as e:
+            test_report.add_test(
+                "Adapter Read Cache",
+                "FAIL",
+                "Read cache misbehaved",
+                str(e)
+            )
+            raise
 
 
 class TestDatabaseConfig:
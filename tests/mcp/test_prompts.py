@@ -201,6 +201,20 @@ class TestFormatPromptResponse:
         assert "- `command1` - Description 1" in response
         assert "- `command2` - Description 2" in response
     
+    def test_formatting_with_content_chunks(self):
+        """Test that chunked content formats like the joined string"""
+        chunks = ["# Title\n\n", "Line one\n", "Line two\n"]
+        suggestions = {"command1": "Description 1"}
+        
+        assert format_prompt_response(content=iter(chunks)) == "".join(chunks)
+        assert format_prompt_response(
+            content=chunks,
+            suggestions=suggestions
+        ) == format_prompt_response(
+            content="".join(chunks),
+            suggestions=suggestions
+        )
+    
     def test_formatting_with_data(self):
         """Test formatting with structured data"""
         response = format_prompt_response(